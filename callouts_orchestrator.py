@@ -17,35 +17,490 @@ Modes:
 
 import sys
 import os
+import io
 import re
+import stat
 import argparse
+import hashlib
 from pathlib import Path
 from collections import defaultdict
 import json
 from datetime import datetime
+from functools import partial
+from itertools import chain, islice
+
+# Optional: faster encoding of the JSON summary
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import our modules
 try:
-    from granular_callput import analyze_block, SUPPORTED_LANGUAGES
-    from converter_utils import get_block_pattern, clean_source_line, normalize_language
-    from yaml_callout import process_file as yaml_process_file
-    from json_callout import process_file as json_process_file
-    from shell_callout import process_file as shell_process_file
-    from python_callout import process_file as python_process_file
-    from go_callout import process_file as go_process_file
-    from generic_callout import process_file as generic_process_file
+    from granular_callput import analyze_block, analyze_block_cached, SUPPORTED_LANGUAGES
+    from converter_utils import (
+        iter_block_matches,
+        clean_source_block,
+        normalize_language,
+        process_files_parallel,
+        read_bytes_if_matching,
+        mapped_file_content,
+        decode_source_bytes,
+        write_file_atomic
+    )
+    from yaml_callout import (
+        process_file as yaml_process_file,
+        convert_yaml_block,
+        extract_terms_from_source as yaml_extract_terms
+    )
+    from json_callout import (
+        process_file as json_process_file,
+        convert_json_block,
+        extract_terms_from_source as json_extract_terms
+    )
+    from shell_callout import (
+        process_file as shell_process_file,
+        convert_shell_block,
+        extract_terms_from_source as shell_extract_terms
+    )
+    from python_callout import (
+        process_file as python_process_file,
+        convert_python_block,
+        extract_terms_from_source as python_extract_terms
+    )
+    from go_callout import (
+        process_file as go_process_file,
+        convert_go_block,
+        extract_terms_from_source as go_extract_terms
+    )
+    from generic_callout import (
+        process_file as generic_process_file,
+        convert_generic_block,
+        extract_terms_from_source as generic_extract_terms
+    )
 except ImportError as e:
     print(f"Error: Required modules not found. Ensure all converter modules are in the same directory.")
     print(f"Details: {e}")
     sys.exit(1)
 
 
+# Patterns used for every scanned file, compiled once at import time
+_INCLUDE_RE = re.compile(r'^include::([^\[]+)\[', re.MULTILINE)
+_ASSEMBLY_MARKER = ':_mod-docs-content-type: ASSEMBLY'
+_ASSEMBLY_MARKER_LINES = 21  # The marker must appear in the first 21 lines
+_ASSEMBLY_HEAD_CHARS = 2048  # One read that covers those lines in typical files
+_ASSEMBLY_MARKER_BYTES = _ASSEMBLY_MARKER.encode()
+_ASSEMBLY_PROBE_BYTES = 4096  # Raw read that rules out most non-assemblies without decoding
+_MARKER_RE = re.compile(r'<(\d+)>')
+
+# Byte-level prefilters, checked through mmap for large files before decoding.
+# Every block header starts with '[source' or '[subs='.
+_SOURCE_HEADER_BYTES_RE = re.compile(rb'\[(?:source|subs=)')
+# Only headers that normalize to a supported language: a supported name, or
+# no name at all ([source], [source,subs=...], [subs=...] default to shell)
+_SUPPORTED_HEADER_BYTES_RE = re.compile(
+    rb'\[(?:subs=|source(?!,)|source,(?:subs|(?:'
+    + b'|'.join(re.escape(lang.encode()) for lang in sorted(SUPPORTED_LANGUAGES))
+    + rb')?(?![\w-])))',
+    re.IGNORECASE
+)
+_INCLUDE_BYTES_RE = re.compile(rb'include::')
+_BINARY_PROBE_BYTES = 1024  # Leading bytes checked for NUL (binary files with an .adoc extension)
+
+# Conversion batches: (batch name, language aliases, file-level converter)
+_LANG_BUCKETS = (
+    ('yaml', ('yaml', 'yml'), yaml_process_file),
+    ('json', ('json',), json_process_file),
+    ('shell', ('bash', 'sh', 'terminal', 'shell', 'console'), shell_process_file),
+    ('python', ('python', 'py'), python_process_file),
+    ('go', ('go', 'golang'), go_process_file),
+    ('text/conf', ('text', 'conf', 'config', 'txt', 'plaintext'), generic_process_file),
+)
+
+# Directories that hold build output, dependencies or tooling rather than docs;
+# the directory walk never enters them (extend with --exclude-dir)
+_PRUNE_DIRS = frozenset(['.git', 'node_modules', '__pycache__', 'build', 'dist', '.venv', 'venv', 'target'])
+
+# Per-file conversion progress lines are written to stdout in batches of this many files
+_PROGRESS_BATCH_FILES = 100
+
+# Classification cache (--cache-dir): entries are keyed by the SHA-256 of this
+# salt plus the file bytes. Bump the version whenever classification rules change.
+_CLASSIFY_CACHE_VERSION = 1
+_CLASSIFY_CACHE_SALT = f"{_CLASSIFY_CACHE_VERSION}:{','.join(sorted(SUPPORTED_LANGUAGES))}\n".encode()
+
+# Block-level converters by language: (extract_terms, convert_block, clean_source_block language)
+_BLOCK_CONVERTERS = {
+    'yaml': (yaml_extract_terms, convert_yaml_block, 'yaml'),
+    'yml': (yaml_extract_terms, convert_yaml_block, 'yaml'),
+    'json': (json_extract_terms, convert_json_block, 'json'),
+    'bash': (shell_extract_terms, convert_shell_block, 'shell'),
+    'sh': (shell_extract_terms, convert_shell_block, 'shell'),
+    'terminal': (shell_extract_terms, convert_shell_block, 'shell'),
+    'shell': (shell_extract_terms, convert_shell_block, 'shell'),
+    'console': (shell_extract_terms, convert_shell_block, 'shell'),
+    'python': (python_extract_terms, convert_python_block, 'python'),
+    'py': (python_extract_terms, convert_python_block, 'python'),
+    'go': (go_extract_terms, convert_go_block, 'go'),
+    'text': (generic_extract_terms, convert_generic_block, 'generic'),
+    'conf': (generic_extract_terms, convert_generic_block, 'generic'),
+    'config': (generic_extract_terms, convert_generic_block, 'generic'),
+}
+
+
+def scan_adoc_file(file_path, debug=False, convert=False, probe_binary=False, cache_dir=None):
+    """
+    Classify a single file's callout blocks, optionally converting them from the same read.
+    
+    The file is read and matched against the block pattern once. With
+    convert=True, a file that has automatable blocks is also converted in
+    memory, so the conversion phase does not need to read and match it again.
+    With probe_binary=True, the binary check of is_valid_adoc_file() is done
+    on the same open file, and failures to open or probe it are reported as
+    a skip instead of an error.
+    With cache_dir, classification results are looked up and stored by
+    content hash there (not in debug mode, whose output needs the analysis).
+    Module-level so it can run in worker processes.
+    
+    Returns: (automatable_langs, manual_issues, error, conversion, skip)
+        conversion is the convert_adoc_file() result, or None if not converted here
+        skip is None, or the files_skipped reason for a file skipped by the binary probe
+    """
+    try:
+        f = open(file_path, 'rb')
+    except Exception as e:
+        if probe_binary:
+            return None, None, None, None, _probe_skip(file_path, e, debug)
+        return None, None, f"Read error: {e}", None, None
+    
+    with f:
+        try:
+            with mapped_file_content(f) as content:
+                # Null bytes near the start indicate binary
+                if probe_binary and content.find(b'\x00', 0, _BINARY_PROBE_BYTES) != -1:
+                    if debug:
+                        print(f"  DEBUG: Skipping binary file: {file_path}")
+                    return None, None, None, None, 'binary'
+                data = content[:] if _SUPPORTED_HEADER_BYTES_RE.search(content) else None
+        except Exception as e:
+            if probe_binary:
+                return None, None, None, None, _probe_skip(file_path, e, debug)
+            return None, None, f"Read error: {e}", None, None
+    
+    # No block header for a supported language anywhere - nothing to classify
+    if data is None:
+        return None, None, None, None, None
+    
+    cache_file = None
+    cached = None
+    if cache_dir and not debug:
+        cache_file = _classification_cache_file(cache_dir, data)
+        cached = _load_cached_classification(cache_file)
+        # Automatable files still need their content when converting from this read
+        if cached is not None and not (convert and cached[0]):
+            return cached[0], cached[1], None, None, None
+    
+    utf8 = True
+    try:
+        content = decode_source_bytes(data, strict=True)
+    except UnicodeDecodeError:
+        # Try other encodings
+        utf8 = False
+        content = decode_source_bytes(data)
+    del data
+    
+    matches = list(iter_block_matches(content))
+    if cached is not None:
+        automatable_langs, manual_issues = cached
+    else:
+        has_markers = _MARKER_RE.search(content) is not None
+        automatable_langs, manual_issues = _classify_blocks(matches, file_path, debug, has_markers)
+        if cache_file:
+            _store_cached_classification(cache_file, automatable_langs, manual_issues)
+    
+    # The conversion phase reads strictly as UTF-8, so only convert content that decoded as such
+    conversion = None
+    if convert and automatable_langs and utf8:
+        conversion = _convert_blocks(content, matches, debug)
+    
+    return automatable_langs, manual_issues, None, conversion, None
+
+
+def _classification_cache_file(cache_dir, data):
+    """Path of the cache entry for a file's raw bytes: {cache_dir}/{h[:2]}/{h}.json"""
+    digest = hashlib.sha256(_CLASSIFY_CACHE_SALT)
+    digest.update(data)
+    h = digest.hexdigest()
+    return os.path.join(cache_dir, h[:2], f"{h}.json")
+
+
+def _load_cached_classification(cache_file):
+    """
+    Read a cached classification.
+    Returns: (automatable_langs, manual_issues), or None on a miss or unreadable entry
+    """
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            langs, issues = json.load(f)
+    except (OSError, ValueError, TypeError):
+        return None
+    if langs is None:
+        return None, None
+    return set(langs), [tuple(issue) for issue in issues]
+
+
+def _store_cached_classification(cache_file, automatable_langs, manual_issues):
+    """Write a classification to the cache; failures only cost a future cache miss."""
+    langs = sorted(automatable_langs) if automatable_langs is not None else None
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        write_file_atomic(cache_file, json.dumps([langs, manual_issues]))
+    except OSError:
+        pass
+
+
+def _indented_json(value, level):
+    """json.dumps(value, indent=2) for a value nested level objects deep in an indent=2 document."""
+    text = None
+    if orjson is not None:
+        try:
+            data = orjson.dumps(value, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # e.g. undecodable path bytes kept as lone surrogates
+            data = None
+        # orjson leaves non-ASCII characters and DEL unescaped, json.dumps escapes them;
+        # only use its output where the two agree
+        if data is not None and data.isascii() and b'\x7f' not in data:
+            text = data.decode('ascii')
+    if text is None:
+        text = json.dumps(value, indent=2)
+    return text.replace('\n', '\n' + '  ' * level)
+
+
+def _write_json_list(f, items, to_json, level):
+    """Write [to_json(item) for item in items] to f as json.dump(..., indent=2) would, one item at a time."""
+    if not items:
+        f.write('[]')
+        return
+    item_indent = '  ' * (level + 1)
+    f.write('[\n')
+    for i, item in enumerate(items):
+        if i:
+            f.write(',\n')
+        f.write(item_indent + _indented_json(to_json(item), level + 1))
+    f.write('\n' + '  ' * level + ']')
+
+
+def _probe_skip(file_path, error, debug=False):
+    """Map an error from opening or probing a file to its is_valid_adoc_file() skip reason."""
+    if isinstance(error, PermissionError):
+        return 'no_permission'
+    if debug:
+        print(f"  DEBUG: Error validating {file_path}: {error}")
+    return 'validation_error'
+
+
+def classify_adoc_file(file_path, debug=False):
+    """
+    Classify a single file's callout blocks
+    Returns: (automatable_langs, manual_issues, error)
+    """
+    return scan_adoc_file(file_path, debug)[:3]
+
+
+def _classify_blocks(matches, file_path, debug=False, has_markers=True):
+    """
+    Classify the block matches of one file.
+    
+    has_markers=False means the file contains no <N> marker at all, so
+    every block that is not an already-converted list is a plain block and
+    the per-block marker analysis is skipped.
+    
+    Returns: (automatable_langs, manual_issues), or (None, None) if no supported blocks
+    """
+    automatable_langs = set()
+    manual_issues = []
+    has_any_blocks = False
+    
+    for match in matches:
+        # Normalize language - handles empty/missing language, defaults to 'shell'
+        raw_lang = match.group(2) or ''
+        language = normalize_language(raw_lang)
+        
+        # Skip unsupported languages
+        if language not in SUPPORTED_LANGUAGES:
+            if debug:
+                print(f"  DEBUG: Unsupported language '{language}' in {file_path}")
+            continue
+        
+        has_any_blocks = True
+        source_content = match.group(4)
+        definition_content = match.group(5)
+        
+        # Check for edge case: already converted (has `::` definition list)
+        if '::' in definition_content and '<' not in definition_content:
+            if debug:
+                print(f"  DEBUG: Already converted definition list in {file_path}")
+            manual_issues.append(('already_converted', 'File appears to already have definition lists'))
+            continue
+        
+        if not has_markers:
+            # Plain source block - nothing to convert or review
+            continue
+        
+        # Validate marker sequence (should be sequential: <1>, <2>, <3>...)
+        # Distinct markers are exactly 1..N when the smallest is 1 and the largest is N
+        source_markers = {int(m) for m in _MARKER_RE.findall(source_content)}
+        if source_markers and (min(source_markers) != 1 or max(source_markers) != len(source_markers)):
+            manual_issues.append((
+                'non_sequential_markers',
+                f'Markers are not sequential: {sorted(source_markers)}'
+            ))
+            continue
+        
+        # Run the analyzer
+        if debug:
+            status, reason = analyze_block(source_content, definition_content, debug)
+        else:
+            status, reason = analyze_block_cached(source_content, definition_content)
+        
+        if status == 'automatable':
+            automatable_langs.add(language)
+        elif status != 'plain_source_block':
+            manual_issues.append((status, reason))
+    
+    if not has_any_blocks:
+        return None, None  # No source blocks at all
+    
+    return automatable_langs, manual_issues
+
+
+def convert_adoc_file(file_path, debug=False):
+    """
+    Convert individual blocks of a file in memory (block-level processing).
+    
+    This function:
+    1. Reads the entire file content into memory
+    2. Loops through every code block
+    3. Classifies and converts each block individually
+    4. Replaces converted blocks in memory
+    
+    It does not write the file, so it can run in worker processes; the
+    orchestrator writes the returned content from the main process.
+    
+    Returns: (success, blocks_converted_count, blocks_skipped_reasons, modified_content)
+        modified_content is None unless at least one block was converted
+    """
+    try:
+        data = read_bytes_if_matching(file_path, (_SOURCE_HEADER_BYTES_RE,))
+        if data is None:
+            return True, 0, [], None
+        content = decode_source_bytes(data, strict=True)
+    except Exception as e:
+        return False, 0, [f"Read error: {e}"], None
+    del data
+    
+    return _convert_blocks(content, iter_block_matches(content), debug)
+
+
+def _convert_blocks(content, matches, debug=False):
+    """
+    Convert the block matches of one file's content in memory.
+    Returns: (success, blocks_converted_count, blocks_skipped_reasons, modified_content)
+    """
+    # Output is rebuilt from slices of the original content and joined once
+    segments = []
+    last_end = 0
+    blocks_converted = 0
+    blocks_skipped = []
+    
+    # Process each block independently
+    for match in matches:
+        # Normalize language - handles empty/missing language, defaults to 'shell'
+        raw_lang = match.group(2) or ''
+        language = normalize_language(raw_lang)
+        source_content = match.group(4)
+        definition_content = match.group(5)
+        
+        # Skip unsupported languages
+        if language not in SUPPORTED_LANGUAGES:
+            blocks_skipped.append(f"Unsupported language: {language}")
+            continue
+        
+        # Check if already converted
+        if '::' in definition_content and '<' not in definition_content:
+            if debug:
+                print(f"     ⏭️  Skipping already-converted block")
+            blocks_skipped.append("Already converted")
+            continue
+        
+        # Analyze the block
+        if debug:
+            status, reason = analyze_block(source_content, definition_content, debug)
+        else:
+            status, reason = analyze_block_cached(source_content, definition_content)
+        
+        if status != 'automatable':
+            if debug:
+                print(f"     ⏭️  Skipping block: {status} - {reason}")
+            blocks_skipped.append(f"{status}: {reason}")
+            continue
+        
+        # Route to appropriate converter based on language
+        converter = _BLOCK_CONVERTERS.get(language)
+        if converter is None:
+            blocks_skipped.append(f"No converter for language: {language}")
+            continue
+        extract_terms, convert_block, clean_lang = converter
+        
+        try:
+            terms = extract_terms(source_content.splitlines())
+            # Clean source using robust cleaner, over the whole block in one pass
+            cleaned_source = clean_source_block(source_content, clean_lang)
+            new_block, complete = convert_block(match, terms, cleaned_source, debug)
+            
+            if complete:
+                # Replace this specific block by its position in the content
+                segments.append(content[last_end:match.start()])
+                segments.append(new_block)
+                last_end = match.end()
+                blocks_converted += 1
+                if debug:
+                    print(f"     ✓ Converted block ({language})")
+            else:
+                blocks_skipped.append(f"Incomplete conversion ({language})")
+                
+        except Exception as e:
+            if debug:
+                print(f"     ❌ Error converting block: {e}")
+            blocks_skipped.append(f"Conversion error: {e}")
+            continue
+    
+    if blocks_converted == 0:
+        return True, 0, blocks_skipped, None
+    segments.append(content[last_end:])
+    return True, blocks_converted, blocks_skipped, ''.join(segments)
+
+
+def _convert_adoc_file_worker(file_path, debug=False):
+    """Run convert_adoc_file(), returning an unexpected exception instead of raising it."""
+    try:
+        return convert_adoc_file(file_path, debug)
+    except Exception as e:
+        return e
+
+
 class CalloutsOrchestrator:
-    def __init__(self, target_path, dry_run=False, debug=False, assembly_mode=False):
+    def __init__(self, target_path, dry_run=False, debug=False, assembly_mode=False, cache_dir=None, jobs=None,
+                 content_cache=True, exclude_dirs=()):
         self.target_path = Path(target_path).resolve()
         self.dry_run = dry_run
         self.debug = debug
         self.assembly_mode = assembly_mode
+        self.cache_dir = cache_dir
+        self.jobs = jobs  # Worker processes for scanning and converting (None: one per CPU)
+        self.content_cache = content_cache  # Convert during the scan and keep the results for Phase 2
+        self.prune_dirs = _PRUNE_DIRS.union(exclude_dirs)  # Directory names the walk skips
         self.single_file_mode = self.target_path.is_file()
         
         # For directory mode, keep target_dir for compatibility
@@ -68,9 +523,15 @@ class CalloutsOrchestrator:
         }
         
         # Classification results
-        self.automatable_by_lang = defaultdict(set)
+        self.automatable_by_lang = defaultdict(list)  # Each file is added once per language
         self.manual_review_files = defaultdict(list)
         
+        # Conversions computed during the scan, consumed on first use by the convert phase
+        self._scan_cache = {}
+        
+        # os.stat() results of resolved include targets, consumed by validation
+        self._stat_cache = {}
+        
     def validate_environment(self):
         """Validate the target path exists and is accessible"""
         if not self.target_path.exists():
@@ -108,17 +569,21 @@ class CalloutsOrchestrator:
         Returns a list of resolved file paths.
         """
         includes = []
-        include_pattern = re.compile(r'^include::([^\[]+)\[', re.MULTILINE)
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            data = read_bytes_if_matching(file_path, (_INCLUDE_BYTES_RE,))
+            if data is None:
+                return includes
+            content = decode_source_bytes(data, strict=True)
         except Exception as e:
             if self.debug:
                 print(f"  DEBUG: Error reading {file_path}: {e}")
             return includes
         
-        for match in include_pattern.finditer(content):
+        # Includes resolve relative to the file's directory
+        file_dir = Path(file_path).parent
+        
+        for match in _INCLUDE_RE.finditer(content):
             include_path = match.group(1).strip()
             
             # Skip attribute references like {snippets-dir}/...
@@ -127,12 +592,16 @@ class CalloutsOrchestrator:
                     print(f"  DEBUG: Skipping attribute-based include: {include_path}")
                 continue
             
-            # Resolve the path relative to the file's directory
-            file_dir = Path(file_path).parent
             resolved_path = (file_dir / include_path).resolve()
             
-            # Check if file exists (following symlinks)
-            if resolved_path.exists():
+            # Check if file exists (following symlinks); validation reuses the stat result
+            try:
+                self._stat_cache[resolved_path] = resolved_path.stat()
+                exists = True
+            except (FileNotFoundError, NotADirectoryError):
+                exists = False
+            
+            if exists:
                 includes.append(resolved_path)
                 if self.debug:
                     print(f"  DEBUG: Resolved include: {include_path} -> {resolved_path}")
@@ -147,13 +616,25 @@ class CalloutsOrchestrator:
         Check if a file is an assembly file (contains :_mod-docs-content-type: ASSEMBLY).
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                # Read first 20 lines to check for assembly marker
-                for i, line in enumerate(f):
-                    if i > 20:
-                        break
-                    if ':_mod-docs-content-type: ASSEMBLY' in line:
-                        return True
+            with open(file_path, 'rb') as raw:
+                # Common case: no marker in the first raw bytes, and those bytes
+                # cover the whole header, so the file cannot be an assembly
+                probe = raw.read(_ASSEMBLY_PROBE_BYTES)
+                if _ASSEMBLY_MARKER_BYTES not in probe and (
+                        len(probe) < _ASSEMBLY_PROBE_BYTES
+                        or probe.count(b'\n') >= _ASSEMBLY_MARKER_LINES):
+                    return False
+                raw.seek(0)
+                
+                with io.TextIOWrapper(raw, encoding='utf-8') as f:
+                    # Check the first lines for the assembly marker with a single bounded read
+                    head = f.read(_ASSEMBLY_HEAD_CHARS)
+                    lines = head.split('\n', _ASSEMBLY_MARKER_LINES)
+                    if len(lines) <= _ASSEMBLY_MARKER_LINES and len(head) == _ASSEMBLY_HEAD_CHARS:
+                        # Long lines: finish the partial last line and read the rest of the header
+                        lines[-1] += f.readline()
+                        lines.extend(islice(f, _ASSEMBLY_MARKER_LINES - len(lines)))
+                    return any(_ASSEMBLY_MARKER in line for line in lines[:_ASSEMBLY_MARKER_LINES])
         except Exception:
             pass
         return False
@@ -188,51 +669,55 @@ class CalloutsOrchestrator:
                     collect_recursive(include_path, depth + 1)
         
         # Find all assembly files in the target directory (NOT following symlinks for assemblies)
-        for root, dirs, files in os.walk(self.target_dir):
-            # Skip hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
-            
-            # Don't follow symlinks when looking for assemblies
-            # We only want assemblies that are physically in the target directory
-            real_root = os.path.realpath(root)
-            if real_root != root and not root.startswith(str(self.target_dir)):
-                continue
+        # We only want assemblies that are physically in the target directory
+        for entry in self._scan_adoc_entries(str(self.target_dir), follow_links=False):
+            file_path = Path(entry.path)
             
-            for filename in files:
-                if not filename.lower().endswith(('.adoc', '.asciidoc')):
-                    continue
-                
-                file_path = Path(root) / filename
+            # Check if it's an assembly
+            if self.is_assembly_file(file_path):
+                self.stats['assemblies_found'] += 1
+                if self.debug:
+                    print(f"  📄 Found assembly: {file_path}")
                 
-                # Check if it's an assembly
-                if self.is_assembly_file(file_path):
-                    self.stats['assemblies_found'] += 1
-                    if self.debug:
-                        print(f"  📄 Found assembly: {file_path}")
-                    
-                    # Collect all includes from this assembly
-                    collect_recursive(file_path)
+                # Collect all includes from this assembly
+                collect_recursive(file_path)
         
         print(f"   Found {self.stats['assemblies_found']} assemblies")
         print(f"   Resolved {self.stats['includes_resolved']} includes")
         print(f"   Total files to process: {len(self.files_to_process)}")
         print("=" * 70)
     
-    def is_valid_adoc_file(self, file_path):
+    def is_valid_adoc_file(self, file_path, entry=None, probe_binary=True):
         """
         Validate that a file is actually an AsciiDoc file and not binary
         Edge cases: symlinks, binary files with .adoc extension, empty files
+        
+        When the os.DirEntry from the directory scan is passed, its cached
+        type and stat information is used instead of new syscalls, and
+        file_path may be the entry's path string.
+        With probe_binary=False the binary check is left to the caller, which
+        does it on the file it opens anyway (see scan_adoc_file()).
         """
         try:
+            # One stat result gives both the file type and the size. Directory scan
+            # entries cache it, and resolved include targets reuse the stat taken
+            # when their include was resolved; other paths need a single lstat.
+            if entry is not None:
+                file_stat = entry.stat(follow_symlinks=False)
+            else:
+                file_stat = self._stat_cache.pop(file_path, None)
+                if file_stat is None:
+                    file_stat = os.lstat(file_path)
+            
             # Check if it's a symlink
-            if file_path.is_symlink():
+            if stat.S_ISLNK(file_stat.st_mode):
                 if self.debug:
                     print(f"  DEBUG: Skipping symlink: {file_path}")
                 self.stats['files_skipped']['symlinks'].append(str(file_path))
                 return False
             
             # Check file size (skip empty or suspiciously large files)
-            file_size = file_path.stat().st_size
+            file_size = file_stat.st_size
             if file_size == 0:
                 if self.debug:
                     print(f"  DEBUG: Skipping empty file: {file_path}")
@@ -245,9 +730,12 @@ class CalloutsOrchestrator:
                 self.stats['files_skipped']['too_large'].append(str(file_path))
                 return False
             
+            if not probe_binary:
+                return True
+            
             # Try to read first few bytes to detect binary
             with open(file_path, 'rb') as f:
-                chunk = f.read(1024)
+                chunk = f.read(_BINARY_PROBE_BYTES)
                 if b'\x00' in chunk:  # Null bytes indicate binary
                     if self.debug:
                         print(f"  DEBUG: Skipping binary file: {file_path}")
@@ -270,69 +758,7 @@ class CalloutsOrchestrator:
         Classify a single file's callout blocks
         Returns: (automatable_langs, manual_issues, error)
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            # Try other encodings
-            try:
-                with open(file_path, 'r', encoding='latin-1') as f:
-                    content = f.read()
-            except Exception as e:
-                return None, None, f"Encoding error: {e}"
-        except Exception as e:
-            return None, None, f"Read error: {e}"
-        
-        pattern = get_block_pattern()
-        automatable_langs = set()
-        manual_issues = []
-        has_any_blocks = False
-        
-        for match in pattern.finditer(content):
-            # Normalize language - handles empty/missing language, defaults to 'shell'
-            raw_lang = match.group(2) or ''
-            language = normalize_language(raw_lang)
-            
-            # Skip unsupported languages
-            if language not in SUPPORTED_LANGUAGES:
-                if self.debug:
-                    print(f"  DEBUG: Unsupported language '{language}' in {file_path}")
-                continue
-            
-            has_any_blocks = True
-            source_content = match.group(4)
-            definition_content = match.group(5)
-            
-            # Check for edge case: already converted (has `::` definition list)
-            if '::' in definition_content and '<' not in definition_content:
-                if self.debug:
-                    print(f"  DEBUG: Already converted definition list in {file_path}")
-                manual_issues.append(('already_converted', 'File appears to already have definition lists'))
-                continue
-            
-            # Validate marker sequence (should be sequential: <1>, <2>, <3>...)
-            source_markers = [int(m) for m in sorted(set(
-                int(m) for m in __import__('re').findall(r'<(\d+)>', source_content)
-            ))]
-            if source_markers and source_markers != list(range(1, len(source_markers) + 1)):
-                manual_issues.append((
-                    'non_sequential_markers',
-                    f'Markers are not sequential: {source_markers}'
-                ))
-                continue
-            
-            # Run the analyzer
-            status, reason = analyze_block(source_content, definition_content, self.debug)
-            
-            if status == 'automatable':
-                automatable_langs.add(language)
-            elif status != 'plain_source_block':
-                manual_issues.append((status, reason))
-        
-        if not has_any_blocks:
-            return None, None, None  # No source blocks at all
-        
-        return automatable_langs, manual_issues, None
+        return classify_adoc_file(file_path, self.debug)
     
     def scan_and_classify(self):
         """Phase 1: Scan all files and classify them"""
@@ -347,20 +773,36 @@ class CalloutsOrchestrator:
             # Default mode: scan all files (following symlinks)
             files_to_scan = self._collect_all_files()
         
-        # Now classify each file
+        # Validate each file (cheap, and records skip statistics in order).
+        # Paths are kept as strings: that is what workers receive and results are keyed by.
+        valid_files = []
         for file_path in files_to_scan:
-            file_path = Path(file_path)
+            entry = None
+            if isinstance(file_path, os.DirEntry):
+                entry, file_path = file_path, file_path.path
             self.stats['total_files_scanned'] += 1
             
-            # Validate file
-            if not self.is_valid_adoc_file(file_path):
+            if self.is_valid_adoc_file(file_path, entry, probe_binary=False):
+                valid_files.append(str(file_path))
+        
+        # Classify files in worker processes; results come back in input order.
+        # The binary probe runs on the same open as the classification read, and
+        # outside dry-run/debug, automatable files are converted from that read too
+        # (held in memory until Phase 2, unless --no-content-cache).
+        convert = self.content_cache and not self.dry_run and not self.debug
+        scan_func = partial(scan_adoc_file, convert=convert, probe_binary=True, cache_dir=self.cache_dir)
+        results = process_files_parallel(scan_func, valid_files, self.debug, self.jobs)
+        
+        for file_path, (automatable_langs, manual_issues, error, conversion, skip) in zip(valid_files, results):
+            if skip is not None:
+                self.stats['files_skipped'][skip].append(file_path)
                 continue
             
-            # Classify
-            automatable_langs, manual_issues, error = self.classify_file(file_path)
+            if conversion is not None:
+                self._scan_cache[file_path] = conversion
             
             if error:
-                self.stats['files_with_errors'].append((str(file_path), error))
+                self.stats['files_with_errors'].append((file_path, error))
                 continue
             
             if automatable_langs is None and manual_issues is None:
@@ -373,12 +815,12 @@ class CalloutsOrchestrator:
             # This allows block-level processing to convert what it can
             if automatable_langs:
                 for lang in automatable_langs:
-                    self.automatable_by_lang[lang].add(str(file_path))
+                    self.automatable_by_lang[lang].append(file_path)
             
             # Also log manual review issues for reporting
             if manual_issues:
                 for issue_type, reason in manual_issues:
-                    self.manual_review_files[issue_type].append((str(file_path), reason))
+                    self.manual_review_files[issue_type].append((file_path, reason))
         
         # Print classification summary
         self._print_classification_summary()
@@ -387,206 +829,131 @@ class CalloutsOrchestrator:
         """
         Collect all .adoc files in the target directory.
         Follows symlinks but prevents infinite loops.
-        """
-        files = set()
-        visited_dirs = set()
         
-        for root, dirs, filenames in os.walk(self.target_dir, followlinks=True):
-            # Resolve real path to detect symlink loops
-            real_root = os.path.realpath(root)
-            if real_root in visited_dirs:
+        Returns os.DirEntry objects so validation can reuse their cached stat data.
+        Symlinked files are counted and reported as skipped here, from the type
+        cached by the directory read, so only regular files are returned.
+        """
+        files = []
+        for entry in self._scan_adoc_entries(str(self.target_dir), follow_links=True):
+            if entry.is_symlink():
+                self.stats['total_files_scanned'] += 1
                 if self.debug:
-                    print(f"  DEBUG: Skipping symlink loop: {root}")
-                dirs[:] = []  # Don't descend further
+                    print(f"  DEBUG: Skipping symlink: {entry.path}")
+                self.stats['files_skipped']['symlinks'].append(entry.path)
                 continue
-            visited_dirs.add(real_root)
+            files.append(entry)
+        return files
+    
+    def _scan_adoc_entries(self, top, follow_links=True):
+        """
+        Recursively yield os.DirEntry objects for .adoc/.asciidoc files under top.
+        
+        Walks top-down with os.scandir (files of a directory before its
+        subdirectories), skipping hidden directories and those named in
+        self.prune_dirs. Entries that are not directories are yielded even if
+        they are symlinks, so the validator can report them. With follow_links, symlinked directories are descended and
+        loops are detected by (st_dev, st_ino); without it they are not entered.
+        """
+        visited_dirs = set()
+        
+        def walk(dir_path, dir_stat):
+            if follow_links:
+                dir_key = (dir_stat.st_dev, dir_stat.st_ino)
+                if dir_key in visited_dirs:
+                    if self.debug:
+                        print(f"  DEBUG: Skipping symlink loop: {dir_path}")
+                    return
+                visited_dirs.add(dir_key)
             
-            # Skip hidden directories
-            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except OSError:
+                return
             
-            for filename in filenames:
-                if filename.lower().endswith(('.adoc', '.asciidoc')):
-                    files.add(Path(root) / filename)
+            subdirs = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Skip hidden and excluded directories
+                    if not entry.name.startswith('.') and entry.name not in self.prune_dirs:
+                        subdirs.append(entry)
+                elif entry.name.lower().endswith(('.adoc', '.asciidoc')):
+                    yield entry
+            
+            for entry in subdirs:
+                if not follow_links and entry.is_symlink():
+                    continue
+                try:
+                    sub_stat = entry.stat() if follow_links else None
+                except OSError:
+                    continue
+                yield from walk(entry.path, sub_stat)
         
-        return files
+        try:
+            top_stat = os.stat(top) if follow_links else None
+        except OSError:
+            return
+        yield from walk(top, top_stat)
+    
+    def _total_manual(self):
+        """Number of manual review entries across all issue types"""
+        return sum(len(files) for files in self.manual_review_files.values())
     
     def _print_classification_summary(self):
         """Print the classification phase summary"""
-        print(f"\n📊 Classification Summary")
-        print("=" * 70)
-        print(f"Total files scanned: {self.stats['total_files_scanned']}")
-        print(f"Files with source blocks: {self.stats['files_with_source_blocks']}")
+        # Assemble the summary and write it in one call
+        out = io.StringIO()
+        print(f"\n📊 Classification Summary", file=out)
+        print("=" * 70, file=out)
+        print(f"Total files scanned: {self.stats['total_files_scanned']}", file=out)
+        print(f"Files with source blocks: {self.stats['files_with_source_blocks']}", file=out)
         
         total_automatable = sum(len(files) for files in self.automatable_by_lang.values())
-        total_manual = sum(len(files) for files in self.manual_review_files.values())
+        total_manual = self._total_manual()
         
-        print(f"\n✅ Ready for automation: {total_automatable} files")
+        print(f"\n✅ Ready for automation: {total_automatable} files", file=out)
         for lang, files in sorted(self.automatable_by_lang.items()):
-            print(f"   - {lang.upper()}: {len(files)} files")
+            print(f"   - {lang.upper()}: {len(files)} files", file=out)
         
-        print(f"\n⚠️  Needs manual review: {total_manual} files")
+        print(f"\n⚠️  Needs manual review: {total_manual} files", file=out)
         for issue_type, files in sorted(self.manual_review_files.items()):
-            print(f"   - {issue_type.replace('_', ' ').title()}: {len(files)} files")
+            print(f"   - {issue_type.replace('_', ' ').title()}: {len(files)} files", file=out)
         
         if self.stats['files_skipped']:
             total_skipped = sum(len(files) for files in self.stats['files_skipped'].values())
-            print(f"\n⏭️  Skipped: {total_skipped} files")
+            print(f"\n⏭️  Skipped: {total_skipped} files", file=out)
             for reason, files in sorted(self.stats['files_skipped'].items()):
                 if files:
-                    print(f"   - {reason.replace('_', ' ').title()}: {len(files)} files")
+                    print(f"   - {reason.replace('_', ' ').title()}: {len(files)} files", file=out)
         
         if self.stats['files_with_errors']:
-            print(f"\n❌ Errors: {len(self.stats['files_with_errors'])} files")
+            print(f"\n❌ Errors: {len(self.stats['files_with_errors'])} files", file=out)
+        
+        sys.stdout.write(out.getvalue())
     
     def convert_file_blocks(self, file_path, debug=False):
         """
         Convert individual blocks in a file (block-level processing).
         
-        This method:
-        1. Reads the entire file content into memory
-        2. Loops through every code block
-        3. Classifies and converts each block individually
-        4. Replaces converted blocks in memory
-        5. Writes the modified content back once at the end
+        Converts the blocks in memory with convert_adoc_file() and writes the
+        modified content back once at the end.
         
         Returns: (success, blocks_converted_count, blocks_skipped_reasons)
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            return False, 0, [f"Read error: {e}"]
-        
-        pattern = get_block_pattern()
-        modified_content = content
-        blocks_converted = 0
-        blocks_skipped = []
-        
-        # Process each block independently
-        for match in pattern.finditer(content):
-            # Normalize language - handles empty/missing language, defaults to 'shell'
-            raw_lang = match.group(2) or ''
-            language = normalize_language(raw_lang)
-            source_content = match.group(4)
-            definition_content = match.group(5)
-            original_block = match.group(0)
-            
-            # Skip unsupported languages
-            if language not in SUPPORTED_LANGUAGES:
-                blocks_skipped.append(f"Unsupported language: {language}")
-                continue
-            
-            # Check if already converted
-            if '::' in definition_content and '<' not in definition_content:
-                if debug:
-                    print(f"     ⏭️  Skipping already-converted block")
-                blocks_skipped.append("Already converted")
-                continue
-            
-            # Analyze the block
-            status, reason = analyze_block(source_content, definition_content, debug)
-            
-            if status != 'automatable':
-                if debug:
-                    print(f"     ⏭️  Skipping block: {status} - {reason}")
-                blocks_skipped.append(f"{status}: {reason}")
-                continue
-            
-            # Route to appropriate converter based on language
-            converter_map = {
-                'yaml': (yaml_process_file, 'yaml'),
-                'yml': (yaml_process_file, 'yaml'),
-                'json': (json_process_file, 'json'),
-                'bash': (shell_process_file, 'shell'),
-                'sh': (shell_process_file, 'shell'),
-                'terminal': (shell_process_file, 'shell'),
-                'shell': (shell_process_file, 'shell'),
-                'console': (shell_process_file, 'shell'),
-                'python': (python_process_file, 'python'),
-                'py': (python_process_file, 'python'),
-                'go': (go_process_file, 'go'),
-                'text': (generic_process_file, 'generic'),
-                'conf': (generic_process_file, 'generic'),
-                'config': (generic_process_file, 'generic'),
-            }
-            
-            if language not in converter_map:
-                blocks_skipped.append(f"No converter for language: {language}")
-                continue
-            
-            converter_func, converter_type = converter_map[language]
-            
-            # For block-level conversion, we need to call the converter's block conversion logic
-            # directly rather than process_file. Let's import the block converters:
-            try:
-                if converter_type == 'yaml':
-                    from yaml_callout import convert_yaml_block, extract_terms_from_source as yaml_extract
-                    terms = yaml_extract(source_content.splitlines())
-                    # Clean source using robust cleaner
-                    cleaned_lines = [clean_source_line(line, 'yaml') for line in source_content.splitlines()]
-                    cleaned_source = '\n'.join(cleaned_lines)
-                    new_block, complete = convert_yaml_block(match, terms, cleaned_source, debug)
-                    
-                elif converter_type == 'json':
-                    from json_callout import convert_json_block, extract_terms_from_source as json_extract
-                    terms = json_extract(source_content.splitlines())
-                    # Clean source using robust cleaner
-                    cleaned_lines = [clean_source_line(line, 'json') for line in source_content.splitlines()]
-                    cleaned_source = '\n'.join(cleaned_lines)
-                    new_block, complete = convert_json_block(match, terms, cleaned_source, debug)
-                    
-                elif converter_type == 'shell':
-                    from shell_callout import convert_shell_block, extract_terms_from_source as shell_extract
-                    terms = shell_extract(source_content.splitlines())
-                    # Clean source using robust cleaner
-                    cleaned_lines = [clean_source_line(line, 'shell') for line in source_content.splitlines()]
-                    cleaned_source = '\n'.join(cleaned_lines)
-                    new_block, complete = convert_shell_block(match, terms, cleaned_source, debug)
-                    
-                elif converter_type == 'python':
-                    from python_callout import convert_python_block, extract_terms_from_source as python_extract
-                    terms = python_extract(source_content.splitlines())
-                    # Clean source using robust cleaner
-                    cleaned_lines = [clean_source_line(line, 'python') for line in source_content.splitlines()]
-                    cleaned_source = '\n'.join(cleaned_lines)
-                    new_block, complete = convert_python_block(match, terms, cleaned_source, debug)
-                    
-                elif converter_type == 'go':
-                    from go_callout import convert_go_block, extract_terms_from_source as go_extract
-                    terms = go_extract(source_content.splitlines())
-                    # Clean source using robust cleaner
-                    cleaned_lines = [clean_source_line(line, 'go') for line in source_content.splitlines()]
-                    cleaned_source = '\n'.join(cleaned_lines)
-                    new_block, complete = convert_go_block(match, terms, cleaned_source, debug)
-                    
-                elif converter_type == 'generic':
-                    from generic_callout import convert_generic_block, extract_terms_from_source as generic_extract
-                    terms = generic_extract(source_content.splitlines())
-                    # Clean source using robust cleaner
-                    cleaned_lines = [clean_source_line(line, 'generic') for line in source_content.splitlines()]
-                    cleaned_source = '\n'.join(cleaned_lines)
-                    new_block, complete = convert_generic_block(match, terms, cleaned_source, debug)
-                
-                else:
-                    blocks_skipped.append(f"Unknown converter type: {converter_type}")
-                    continue
-                
-                if complete:
-                    # Replace this specific block in the content
-                    modified_content = modified_content.replace(original_block, new_block, 1)
-                    blocks_converted += 1
-                    if debug:
-                        print(f"     ✓ Converted block ({language})")
-                else:
-                    blocks_skipped.append(f"Incomplete conversion ({language})")
-                    
-            except Exception as e:
-                if debug:
-                    print(f"     ❌ Error converting block: {e}")
-                blocks_skipped.append(f"Conversion error: {e}")
-                continue
+        return self._write_converted_content(file_path, convert_adoc_file(file_path, debug))
+    
+    def _write_converted_content(self, file_path, result):
+        """
+        Write back the content produced by convert_adoc_file() if anything changed.
         
-        # Write back the modified content if anything changed
+        Returns: (success, blocks_converted_count, blocks_skipped_reasons)
+        """
+        success, blocks_converted, blocks_skipped, modified_content = result
         if blocks_converted > 0 and not self.dry_run:
             try:
                 with open(file_path, 'w', encoding='utf-8') as f:
@@ -594,7 +961,7 @@ class CalloutsOrchestrator:
             except Exception as e:
                 return False, blocks_converted, blocks_skipped + [f"Write error: {e}"]
         
-        return True, blocks_converted, blocks_skipped
+        return success, blocks_converted, blocks_skipped
 
     def convert_files(self):
         """Phase 2: Convert automatable files"""
@@ -605,50 +972,15 @@ class CalloutsOrchestrator:
         print(f"\n🔄 {'[DRY RUN] ' if self.dry_run else ''}Converting files...")
         print("=" * 70)
         
-        # YAML/YML
-        if 'yaml' in self.automatable_by_lang or 'yml' in self.automatable_by_lang:
-            yaml_files = self.automatable_by_lang.get('yaml', set()) | self.automatable_by_lang.get('yml', set())
-            self._convert_language_files(yaml_files, 'yaml', yaml_process_file)
-        
-        # JSON
-        if 'json' in self.automatable_by_lang:
-            self._convert_language_files(self.automatable_by_lang['json'], 'json', json_process_file)
-        
-        # Shell (bash, sh, terminal)
-        shell_langs = {'bash', 'sh', 'terminal', 'shell', 'console'}
-        shell_files = set()
-        for lang in shell_langs:
-            if lang in self.automatable_by_lang:
-                shell_files |= self.automatable_by_lang[lang]
-        if shell_files:
-            self._convert_language_files(shell_files, 'shell', shell_process_file)
-        
-        # Python
-        python_langs = {'python', 'py'}
-        python_files = set()
-        for lang in python_langs:
-            if lang in self.automatable_by_lang:
-                python_files |= self.automatable_by_lang[lang]
-        if python_files:
-            self._convert_language_files(python_files, 'python', python_process_file)
-        
-        # Go
-        go_langs = {'go', 'golang'}
-        go_files = set()
-        for lang in go_langs:
-            if lang in self.automatable_by_lang:
-                go_files |= self.automatable_by_lang[lang]
-        if go_files:
-            self._convert_language_files(go_files, 'go', go_process_file)
-        
-        # Generic (text, conf)
-        generic_langs = {'text', 'conf', 'config', 'txt', 'plaintext'}
-        generic_files = set()
-        for lang in generic_langs:
-            if lang in self.automatable_by_lang:
-                generic_files |= self.automatable_by_lang[lang]
-        if generic_files:
-            self._convert_language_files(generic_files, 'text/conf', generic_process_file)
+        # One batch per converter, in a fixed order; each batch covers all its language aliases
+        for lang_name, langs, converter_func in _LANG_BUCKETS:
+            files = self._files_for_langs(langs)
+            if files:
+                self._convert_language_files(files, lang_name, converter_func)
+    
+    def _files_for_langs(self, langs):
+        """Unique automatable file paths for a group of language names."""
+        return set(chain.from_iterable(self.automatable_by_lang.get(lang, ()) for lang in langs))
     
     def _convert_language_files(self, file_list, lang_name, converter_func):
         """
@@ -658,40 +990,71 @@ class CalloutsOrchestrator:
         """
         print(f"\n📝 Converting {lang_name.upper()} files ({len(file_list)} files)...")
         
-        for file_path in sorted(file_list):
+        sorted_files = sorted(file_list)
+        if self.dry_run:
+            results = [None] * len(sorted_files)
+        else:
+            # Reuse conversions from the scan; a file is taken from the cache only once,
+            # so a later language group re-reads what the earlier group wrote
+            results = [self._scan_cache.pop(file_path, None) for file_path in sorted_files]
+            
+            # Convert the rest in worker processes; files are written here, in sorted order
+            pending = [file_path for file_path, result in zip(sorted_files, results) if result is None]
+            converted = iter(process_files_parallel(_convert_adoc_file_worker, pending, self.debug, self.jobs))
+            results = [next(converted) if result is None else result for result in results]
+        
+        # Per-file progress lines are collected and written once per language batch
+        out = io.StringIO()
+        try:
+            self._report_language_results(sorted_files, results, lang_name, out)
+        finally:
+            sys.stdout.write(out.getvalue())
+    
+    def _report_language_results(self, sorted_files, results, lang_name, out):
+        """Write back a language batch's conversions, recording stats and progress lines in out."""
+        for count, (file_path, result) in enumerate(zip(sorted_files, results), start=1):
             try:
                 if self.dry_run:
-                    print(f"   [DRY RUN] Would convert: {file_path}")
+                    print(f"   [DRY RUN] Would convert: {file_path}", file=out)
                     self.stats['files_converted'][lang_name] += 1
                 else:
+                    if isinstance(result, Exception):
+                        raise result
+                    
                     # Use block-level processing
-                    success, blocks_converted, blocks_skipped = self.convert_file_blocks(file_path, debug=self.debug)
+                    success, blocks_converted, blocks_skipped = self._write_converted_content(file_path, result)
                     
                     if blocks_converted > 0:
-                        print(f"   ✓ Converted: {file_path} ({blocks_converted} blocks)")
+                        print(f"   ✓ Converted: {file_path} ({blocks_converted} blocks)", file=out)
                         self.stats['files_converted'][lang_name] += 1
                         self.stats['blocks_converted'][lang_name] += blocks_converted
                         
                         # Log skipped blocks if any
                         if blocks_skipped and self.debug:
                             for reason in blocks_skipped:
-                                print(f"      ⏭️  Skipped block: {reason}")
+                                print(f"      ⏭️  Skipped block: {reason}", file=out)
                     elif blocks_skipped:
-                        print(f"   ⏭️  No blocks converted: {file_path}")
+                        print(f"   ⏭️  No blocks converted: {file_path}", file=out)
                         if self.debug:
                             for reason in blocks_skipped[:3]:  # Show first 3 reasons
-                                print(f"      {reason}")
+                                print(f"      {reason}", file=out)
                     elif not success:
-                        print(f"   ❌ Error: {file_path}")
+                        print(f"   ❌ Error: {file_path}", file=out)
                         self.stats['files_with_errors'].append((file_path, "Conversion failed"))
                     else:
                         self.stats['files_skipped']['no_callouts'].append(file_path)
                         
             except Exception as e:
-                print(f"   ❌ Error: {file_path}")
+                print(f"   ❌ Error: {file_path}", file=out)
                 if self.debug:
-                    print(f"      {e}")
+                    print(f"      {e}", file=out)
                 self.stats['files_with_errors'].append((file_path, str(e)))
+            
+            # Show progress on long batches without a write per file
+            if count % _PROGRESS_BATCH_FILES == 0:
+                sys.stdout.write(out.getvalue())
+                out.seek(0)
+                out.truncate()
     
     def generate_reports(self):
         """Phase 3: Generate detailed reports"""
@@ -703,73 +1066,91 @@ class CalloutsOrchestrator:
         # Manual review list
         if self.manual_review_files:
             manual_file = f"manual_review_{timestamp}.txt"
+            # Build the report in memory and write it in one call
+            parts = [
+                "=" * 70 + "\n",
+                "FILES REQUIRING MANUAL REVIEW\n",
+                f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+                "=" * 70 + "\n\n",
+            ]
+            for issue_type, files in sorted(self.manual_review_files.items()):
+                parts.append(f"\n{issue_type.replace('_', ' ').upper()}\n")
+                parts.append("-" * 70 + "\n")
+                for file_path, reason in files:
+                    parts.append(f"  {file_path}\n    Reason: {reason}\n")
             with open(manual_file, 'w') as f:
-                f.write("=" * 70 + "\n")
-                f.write("FILES REQUIRING MANUAL REVIEW\n")
-                f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write("=" * 70 + "\n\n")
-                
-                for issue_type, files in sorted(self.manual_review_files.items()):
-                    f.write(f"\n{issue_type.replace('_', ' ').upper()}\n")
-                    f.write("-" * 70 + "\n")
-                    for file_path, reason in files:
-                        f.write(f"  {file_path}\n")
-                        f.write(f"    Reason: {reason}\n")
+                f.write(''.join(parts))
             
             print(f"   ✓ Manual review list: {manual_file}")
         
-        # Conversion summary (JSON)
+        # Conversion summary (JSON), streamed member by member so the per-file
+        # lists are written straight from the collected results
         summary_file = f"conversion_summary_{timestamp}.json"
+        statistics = {
+            'total_files_scanned': self.stats['total_files_scanned'],
+            'files_with_source_blocks': self.stats['files_with_source_blocks'],
+            'files_converted': dict(self.stats['files_converted']),
+            'files_manual_review': self._total_manual(),
+            'files_skipped': {k: len(v) for k, v in self.stats['files_skipped'].items()},
+            'files_with_errors': len(self.stats['files_with_errors'])
+        }
         with open(summary_file, 'w') as f:
-            summary = {
-                'timestamp': datetime.now().isoformat(),
-                'target_directory': str(self.target_dir),
-                'dry_run': self.dry_run,
-                'statistics': {
-                    'total_files_scanned': self.stats['total_files_scanned'],
-                    'files_with_source_blocks': self.stats['files_with_source_blocks'],
-                    'files_converted': dict(self.stats['files_converted']),
-                    'files_manual_review': len([f for files in self.manual_review_files.values() for f in files]),
-                    'files_skipped': {k: len(v) for k, v in self.stats['files_skipped'].items()},
-                    'files_with_errors': len(self.stats['files_with_errors'])
-                },
-                'manual_review_files': {
-                    k: [{'file': f, 'reason': r} for f, r in v] 
-                    for k, v in self.manual_review_files.items()
-                },
-                'errors': [{'file': f, 'error': e} for f, e in self.stats['files_with_errors']]
-            }
-            json.dump(summary, f, indent=2)
+            f.write('{\n')
+            f.write(f'  "timestamp": {json.dumps(datetime.now().isoformat())},\n')
+            f.write(f'  "target_directory": {json.dumps(str(self.target_dir))},\n')
+            f.write(f'  "dry_run": {json.dumps(self.dry_run)},\n')
+            f.write(f'  "statistics": {_indented_json(statistics, 1)},\n')
+            
+            f.write('  "manual_review_files": ')
+            if self.manual_review_files:
+                f.write('{\n')
+                remaining = len(self.manual_review_files)
+                for issue_type, files in self.manual_review_files.items():
+                    remaining -= 1
+                    f.write(f'    {json.dumps(issue_type)}: ')
+                    _write_json_list(f, files, lambda entry: {'file': entry[0], 'reason': entry[1]}, 2)
+                    f.write(',\n' if remaining else '\n')
+                f.write('  },\n')
+            else:
+                f.write('{},\n')
+            
+            f.write('  "errors": ')
+            _write_json_list(f, self.stats['files_with_errors'], lambda entry: {'file': entry[0], 'error': entry[1]}, 1)
+            f.write('\n}')
         
         print(f"   ✓ Detailed summary: {summary_file}")
     
     def print_final_summary(self):
         """Print final summary with actionable next steps"""
-        print(f"\n{'=' * 70}")
-        print("🎉 CONVERSION COMPLETE")
-        print("=" * 70)
+        # Assemble the summary and write it in one call
+        out = io.StringIO()
+        print(f"\n{'=' * 70}", file=out)
+        print("🎉 CONVERSION COMPLETE", file=out)
+        print("=" * 70, file=out)
         
         total_converted = sum(self.stats['files_converted'].values())
-        total_manual = sum(len(files) for files in self.manual_review_files.values())
+        total_manual = self._total_manual()
         total_errors = len(self.stats['files_with_errors'])
         
-        print(f"\n✅ Successfully converted: {total_converted} files")
+        print(f"\n✅ Successfully converted: {total_converted} files", file=out)
         for lang, count in sorted(self.stats['files_converted'].items()):
-            print(f"   - {lang.upper()}: {count} files")
+            print(f"   - {lang.upper()}: {count} files", file=out)
         
         if total_manual > 0:
-            print(f"\n⚠️  Requires manual review: {total_manual} files")
-            print(f"   See manual_review_*.txt for details")
+            print(f"\n⚠️  Requires manual review: {total_manual} files", file=out)
+            print(f"   See manual_review_*.txt for details", file=out)
         
         if total_errors > 0:
-            print(f"\n❌ Errors encountered: {total_errors} files")
-            print(f"   See conversion_summary_*.json for details")
+            print(f"\n❌ Errors encountered: {total_errors} files", file=out)
+            print(f"   See conversion_summary_*.json for details", file=out)
         
         if self.dry_run:
-            print(f"\nℹ️  DRY RUN MODE - No files were modified")
-            print(f"   Run without --dry-run to apply changes")
+            print(f"\nℹ️  DRY RUN MODE - No files were modified", file=out)
+            print(f"   Run without --dry-run to apply changes", file=out)
         
-        print()
+        print(file=out)
+        
+        sys.stdout.write(out.getvalue())
     
     def run(self):
         """Main orchestrator workflow"""
@@ -907,7 +1288,39 @@ Examples:
              'modules from a shared modules/ directory.'
     )
     
+    parser.add_argument(
+        '--cache-dir',
+        metavar='DIR',
+        help='Cache classification results by file content in DIR '
+             '(e.g. ~/.cache/callouts_orchestrator), so reruns skip unchanged files'
+    )
+    
+    parser.add_argument(
+        '--jobs', '-j',
+        type=int,
+        metavar='N',
+        help='Number of worker processes for scanning and converting (default: one per CPU; 1 disables parallelism)'
+    )
+    
+    parser.add_argument(
+        '--no-content-cache',
+        action='store_true',
+        help='Do not keep converted file content in memory between the scan and conversion '
+             'phases; files are read again when converted (lower memory use on very large trees)'
+    )
+    
+    parser.add_argument(
+        '--exclude-dir',
+        action='append',
+        default=[],
+        metavar='NAME',
+        help='Do not descend into directories with this name (repeatable). '
+             'Always skipped: ' + ', '.join(sorted(_PRUNE_DIRS))
+    )
+    
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error('--jobs must be at least 1')
     
     print("=" * 70)
     print("ASCIIDOC CALLOUTS CONVERSION ORCHESTRATOR")
@@ -926,7 +1339,11 @@ Examples:
         target_path=args.target_path,
         dry_run=args.dry_run,
         debug=args.debug,
-        assembly_mode=args.assembly_mode
+        assembly_mode=args.assembly_mode,
+        cache_dir=os.path.expanduser(args.cache_dir) if args.cache_dir else None,
+        jobs=args.jobs,
+        content_cache=not args.no_content_cache,
+        exclude_dirs=args.exclude_dir
     )
     
     return orchestrator.run()
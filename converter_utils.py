@@ -5,7 +5,78 @@ This module contains common functions used across all language-specific converte
 to ensure consistency and maintainability (DRY principle).
 """
 
+import mmap
+import os
 import re
+import sys
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Possessive quantifier suffix, supported by re from Python 3.11. Only used where
+# the next token cannot match the repeated class, so it never changes what
+# matches; it just stops the engine from backtracking into those runs.
+_POSSESSIVE = '+' if sys.version_info >= (3, 11) else ''
+
+# Files larger than this are prefiltered through mmap instead of a full read
+MMAP_THRESHOLD = 256 * 1024
+
+# process_files_parallel(): below this many files a worker pool costs more to
+# start than it saves; above it, workers take files in chunks of at most this size
+PARALLEL_MIN_FILES = 16
+PARALLEL_MAX_CHUNKSIZE = 64
+
+# Comment syntax per language type, used when stripping callout comments
+_COMMENT_PATTERNS = {
+    'yaml': r'#',
+    'python': r'#',
+    'shell': r'#',
+    'go': r'//',
+    'json': r'(?://|#)',  # JSON doesn't have comments, but handle anyway
+    'generic': r'#'
+}
+
+
+def _compile_block_cleanup_pattern(comment_char):
+    """
+    Build the single-pass cleanup regex used by clean_source_block().
+    
+    Each match is either a lone callout marker or a line's trailing run of
+    whitespace (with any markers inside it), optionally ending in a bare
+    comment marker. Markers are removed in the same pass, so they may appear
+    anywhere inside that run, even between the two slashes of '//'. A
+    trailing run is only tried where a whitespace run starts, to avoid
+    re-scanning indentation from every position.
+    """
+    marker = r'<\d+>'
+    space = r'[^\S\n]'
+    comment = comment_char.replace('//', rf'/(?:{marker})*/')
+    tail = rf'(?:{space}|{marker})*(?:{comment}(?:{space}|{marker})*)?$'
+    return re.compile(
+        rf'{space}(?<!{space}{space}){tail}|{marker}(?:(?:{marker})*{space}{tail})?',
+        re.MULTILINE
+    )
+
+
+# Marker and trailing-comment cleanup for whole blocks, per language type
+_BLOCK_CLEANUP_PATTERNS = {
+    language_type: _compile_block_cleanup_pattern(comment_char)
+    for language_type, comment_char in _COMMENT_PATTERNS.items()
+}
+
+
+# Patterns used by parse_and_replace_definitions(), compiled once at import time
+# One match per definition line tells its kind: marker line (groups 1-2: number,
+# explanation), continuation '+' (group 3) or list item (group 4)
+_DEF_LINE_RE = re.compile(r'^\s*(?:<(\d+)>\s*(.*)$|(\+)$|([*+-])\s)')
+_LIST_ITEM_RE = re.compile(r'^\s*[*+-]\s+')
+_MARKER_NUM_RE = re.compile(r'<(\d+)>')
+
+# Patterns used by detect_edge_cases()
+_COMMENT_ONLY_RE = re.compile(r'^[#/]+\s*$')
+_ALL_CAPS_TOKEN_RE = re.compile(r'\b[A-Z_]{3,}\b')
 
 
 def parse_and_replace_definitions(def_content, terms, use_backticks=True, debug=False):
@@ -33,26 +104,25 @@ def parse_and_replace_definitions(def_content, terms, use_backticks=True, debug=
     """
     def_lines = def_content.splitlines()
     new_defs = []
-    marker_pattern = re.compile(r'^\s*<(\d+)>\s*(.*)$')
-    continuation_pattern = re.compile(r'^\s*\+$')
-    list_item_pattern = re.compile(r'^\s*[*+-]\s+')
+    list_item_pattern = _LIST_ITEM_RE
+    # Format term with or without backticks based on language type
+    definition_format = "`{}`:: {}" if use_backticks else "{}:: {}"
     current_explanation = []
     current_marker = None
 
     for line in def_lines + ['']:  # Trailing '' flushes final state
         stripped_line = line.strip()
-        is_continuation = continuation_pattern.match(line)
-        is_list_item = list_item_pattern.match(line)
+        line_match = _DEF_LINE_RE.match(line)
+        is_continuation = line_match is not None and line_match.group(3) is not None
+        is_list_item = line_match is not None and line_match.group(4) is not None
 
-        match = marker_pattern.match(line)
+        match = line_match if line_match is not None and line_match.group(1) is not None else None
         if match:
             # Flush prior explanation
             if current_marker:
                 joined_exp = '\n'.join(current_explanation).strip()
                 if current_marker in terms:
-                    # Format term with or without backticks based on language type
-                    term_formatted = f"`{terms[current_marker]}`" if use_backticks else terms[current_marker]
-                    new_defs.append(f"{term_formatted}:: {joined_exp}")
+                    new_defs.append(definition_format.format(terms[current_marker], joined_exp))
                 else:
                     # Fallback for unmatched markers
                     new_defs.append(line)
@@ -87,19 +157,21 @@ def parse_and_replace_definitions(def_content, terms, use_backticks=True, debug=
     if current_marker:
         joined_exp = '\n'.join(current_explanation).strip()
         if current_marker in terms:
-            term_formatted = f"`{terms[current_marker]}`" if use_backticks else terms[current_marker]
-            new_defs.append(f"{term_formatted}:: {joined_exp}")
+            new_defs.append(definition_format.format(terms[current_marker], joined_exp))
         else:
             new_defs.append('\n'.join(current_explanation))
 
-    # Sort by marker number (inf fallback for non-matches)
-    def sort_key(l):
-        match = re.search(r'<(\d+)>', l)
-        return int(match.group(1)) if match else float('inf')
-    sorted_defs = sorted(new_defs, key=sort_key)
-
     # Completeness check: No lingering markers
-    complete = len(re.findall(r'<(\d+)>', '\n'.join(sorted_defs))) == 0
+    marker_matches = [_MARKER_NUM_RE.search(d) for d in new_defs]
+    complete = not any(marker_matches)
+
+    # Sort by marker number (inf fallback for non-matches). Converted definitions
+    # carry no marker, so a complete list already is in sorted order.
+    if complete:
+        sorted_defs = new_defs
+    else:
+        sort_keys = [int(match.group(1)) if match else float('inf') for match in marker_matches]
+        sorted_defs = [d for _, d in sorted(zip(sort_keys, new_defs), key=lambda pair: pair[0])]
     
     return '\n\n'.join(sorted_defs), complete
 
@@ -121,7 +193,7 @@ def detect_edge_cases(source_lines, marker_pattern=None):
         - Multiple markers on same line
     """
     if marker_pattern is None:
-        marker_pattern = re.compile(r'<(\d+)>')
+        marker_pattern = _MARKER_NUM_RE
     
     for line_num, line in enumerate(source_lines, start=1):
         markers = marker_pattern.findall(line)
@@ -139,12 +211,16 @@ def detect_edge_cases(source_lines, marker_pattern=None):
         pre_marker = line[:marker_pos].strip()
         
         # Edge case: Comment-only line (just # or // with no other content)
-        if re.match(r'^[#/]+\s*$', pre_marker):
+        if _COMMENT_ONLY_RE.match(pre_marker):
             return (True, 'comment_only_callout', f'Line {line_num} has callout on comment-only line')
         
         # Edge case: All-caps tokens suggesting semantic placeholders
         # Example: USER, PASSWORD, URL - these usually need refactoring, not just term extraction
-        all_caps_tokens = re.findall(r'\b[A-Z_]{3,}\b', pre_marker)
+        # Two tokens take at least 7 characters ('ABC DEF'), and a text that is all
+        # lowercase with no '_' has none; most lines are ruled out without the regex
+        if len(pre_marker) < 7 or ('_' not in pre_marker and pre_marker.islower()):
+            continue
+        all_caps_tokens = _ALL_CAPS_TOKEN_RE.findall(pre_marker)
         if all_caps_tokens and len(all_caps_tokens) >= 2:
             return (True, 'semantic_placeholders', 
                    f'Line {line_num} has all-caps tokens ({", ".join(all_caps_tokens[:3])}) suggesting semantic refactoring needed')
@@ -165,30 +241,236 @@ def clean_source_line(line, language_type='generic'):
         str: Cleaned line
     """
     # First, remove the marker itself
-    cleaned = re.sub(r'<(\d+)>', '', line).rstrip()
+    has_marker = '<' in line
+    cleaned = _MARKER_NUM_RE.sub('', line).rstrip() if has_marker else line.rstrip()
     
     # Language-specific comment handling
-    comment_patterns = {
-        'yaml': r'#',
-        'python': r'#',
-        'shell': r'#',
-        'go': r'//',
-        'json': r'(?://|#)',  # JSON doesn't have comments, but handle anyway
-        'generic': r'#'
-    }
+    marker_comment_pattern, trailing_comment_pattern, comment_chars = _line_cleanup_patterns(language_type)
     
-    comment_char = comment_patterns.get(language_type, '#')
+    # Most lines have no comment character at all; nothing else can match then
+    if not any(c in line for c in comment_chars):
+        return cleaned
     
     # Remove trailing comment if it was only for the callout
-    if re.search(rf'{comment_char}\s*<\d+>\s*$', line):
-        cleaned = re.sub(rf'{comment_char}\s*<\d+>\s*$', '', cleaned).rstrip()
+    if has_marker and marker_comment_pattern.search(line):
+        cleaned = marker_comment_pattern.sub('', cleaned).rstrip()
     
     # Also clean standalone trailing comment markers
-    cleaned = re.sub(rf'\s+{comment_char}\s*$', '', cleaned)
+    cleaned = trailing_comment_pattern.sub('', cleaned)
     
     return cleaned
 
 
+@lru_cache(maxsize=16)
+def _line_cleanup_patterns(language_type):
+    """
+    Compiled (callout comment, trailing comment) patterns for clean_source_line(),
+    plus the characters a comment for language_type can start with.
+    """
+    comment_char = _COMMENT_PATTERNS.get(language_type, '#')
+    return (
+        re.compile(rf'{comment_char}\s*<\d+>\s*$'),
+        re.compile(rf'\s+{comment_char}\s*$'),
+        tuple(c for c in '#/' if c in comment_char),
+    )
+
+
+def clean_source_block(source_content, language_type='generic'):
+    """
+    Clean all lines of a source block, removing callout markers and trailing comments.
+    
+    Produces the same result as joining clean_source_line() over
+    source_content.splitlines(), but makes a single regex pass over the whole
+    block instead of several substitutions per line.
+    
+    Args:
+        source_content (str): The source block content
+        language_type (str): Language type for language-specific cleaning
+            Options: 'yaml', 'json', 'shell', 'python', 'go', 'generic'
+    
+    Returns:
+        str: Cleaned block, lines joined with '\\n'
+    """
+    cleanup_pattern = _BLOCK_CLEANUP_PATTERNS.get(language_type, _BLOCK_CLEANUP_PATTERNS['generic'])
+    return cleanup_pattern.sub('', '\n'.join(source_content.splitlines()))
+
+
+def read_bytes_if_matching(file_path, patterns):
+    """
+    Read a file's raw bytes only if every bytes pattern matches somewhere in it.
+    
+    Files over MMAP_THRESHOLD are searched through a read-only memory map,
+    so large files that fail the check are never copied into memory.
+    
+    Args:
+        file_path (str): Path of the file to read
+        patterns (iterable): Compiled bytes regex patterns that must all match
+    
+    Returns:
+        bytes or None: File content, or None if any pattern does not match
+    
+    Raises:
+        OSError: If the file cannot be opened or read
+    """
+    with open(file_path, 'rb') as f:
+        return read_stream_if_matching(f, patterns)
+
+
+def read_stream_if_matching(f, patterns):
+    """
+    Same as read_bytes_if_matching() for a file already opened in binary mode.
+    
+    Args:
+        f (file): File object opened with 'rb'
+        patterns (iterable): Compiled bytes regex patterns that must all match
+    
+    Returns:
+        bytes or None: File content, or None if any pattern does not match
+    """
+    with mapped_file_content(f) as content:
+        if not all(pattern.search(content) for pattern in patterns):
+            return None
+        # Copies a memory map; returns bytes content as is
+        return content[:]
+
+
+@contextmanager
+def mapped_file_content(f):
+    """
+    Expose the whole content of a file opened in binary mode, without copying large files.
+    
+    Files over MMAP_THRESHOLD are exposed as a read-only memory map, smaller
+    ones are read into bytes. Both support find(), slicing and bytes regex
+    searches. The whole file is used regardless of the current position.
+    
+    Args:
+        f (file): File object opened with 'rb'
+    
+    Yields:
+        mmap.mmap or bytes: File content, valid until the context exits
+    """
+    if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Content is scanned front to back: let the kernel read ahead aggressively
+            if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mm
+    else:
+        f.seek(0)
+        yield f.read()
+
+
+def decode_source_bytes(data, strict=False):
+    """
+    Decode raw file bytes the way the converters read text files.
+    
+    Tries UTF-8 first and falls back to latin-1, then normalizes line endings
+    as text-mode open() would, so callers can filter on bytes before paying
+    for decoding.
+    
+    Args:
+        data (bytes): Raw file content
+        strict (bool): Decode as UTF-8 only, without the latin-1 fallback
+    
+    Returns:
+        str: Decoded content with '\\n' line endings
+    
+    Raises:
+        UnicodeDecodeError: If strict and the data is not valid UTF-8
+    """
+    if strict:
+        text = data.decode('utf-8')
+    else:
+        try:
+            text = data.decode('utf-8')
+        except UnicodeDecodeError:
+            text = data.decode('latin-1')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def write_file_atomic(file_path, content, encoding='utf-8'):
+    """
+    Write content to a file by way of a temporary file and os.replace().
+    
+    The temporary file is created next to the target (after resolving
+    symlinks), so the swap is atomic: a crash or write error leaves the
+    original file untouched instead of truncated. The original file's
+    permission bits are preserved.
+    
+    Args:
+        file_path (str): Path of the file to overwrite
+        content (str): New file content
+        encoding (str): Text encoding used for the write
+    
+    Raises:
+        OSError: If the temporary file cannot be written or swapped in
+    """
+    target_path = os.path.realpath(file_path)
+    fd, tmp_path = tempfile.mkstemp(prefix='.callouts-', suffix='.tmp',
+                                    dir=os.path.dirname(target_path))
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding) as f:
+            f.write(content)
+        try:
+            os.chmod(tmp_path, os.stat(target_path).st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _process_file_task(task):
+    """Worker entry point for process_files_parallel(); must be module level to pickle."""
+    process_func, file_path, count, debug = task
+    return [process_func(file_path, debug) for _ in range(count)]
+
+
+def process_files_parallel(process_func, file_paths, debug=False, max_workers=None):
+    """
+    Run a converter's process_file() over many files using a process pool.
+    
+    Files are independent, so the regex-heavy conversion work scales across
+    cores. A path listed more than once (e.g. a file present in several
+    language groups of the classifier JSON) is handled by a single worker,
+    repeated in order, so the same file is never rewritten concurrently.
+    Falls back to a plain loop in debug mode (to keep output ordered), for
+    fewer than PARALLEL_MIN_FILES files, or when only one worker is available.
+    
+    Args:
+        process_func (callable): Module-level function taking (file_path, debug)
+        file_paths (list): Paths to process
+        debug (bool): Passed through to process_func
+        max_workers (int, optional): Pool size. Defaults to os.cpu_count()
+    
+    Returns:
+        list: process_func results, in the same order as file_paths
+    """
+    counts = {}
+    for file_path in file_paths:
+        counts[file_path] = counts.get(file_path, 0) + 1
+    tasks = [(process_func, file_path, count, debug) for file_path, count in counts.items()]
+    
+    workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    if debug or workers < 2 or len(tasks) < PARALLEL_MIN_FILES:
+        task_results = [_process_file_task(task) for task in tasks]
+    else:
+        # About four chunks per worker balances load; the cap keeps big runs balanced too
+        chunksize = max(1, min(PARALLEL_MAX_CHUNKSIZE, len(tasks) // (workers * 4)))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            task_results = list(executor.map(_process_file_task, tasks, chunksize=chunksize))
+    
+    # Hand results back per occurrence, in input order
+    pending = {task[1]: iter(results) for task, results in zip(tasks, task_results)}
+    return [next(pending[file_path]) for file_path in file_paths]
+
+
 def validate_marker_sequence(markers):
     """
     Validate that markers are sequential (1, 2, 3...) not (1, 3, 5...).
@@ -226,19 +508,27 @@ def get_block_pattern():
     Does NOT match:
     - [id=...], [role=...] or other non-source/subs blocks
     
+    The pattern is compiled once, at import time; every call returns the same object.
+    
     Returns:
         re.Pattern: Compiled regex pattern
     """
+    return _BLOCK_PATTERN
+
+
+def _compile_block_pattern():
+    """Compile the get_block_pattern() regex."""
+    p = _POSSESSIVE
     pattern_string = (
         # Group 1: Full header line
         # Matches: [source,lang,...] OR [source,subs=...] OR [source] OR [subs=...]
-        r'(\s*\[(?:source(?:,([a-zA-Z0-9_\-]*))?|subs=)[^\]]*\]\s*\n)'
+        rf'(\s*{p}\[(?:source(?:,([a-zA-Z0-9_\-]*{p}))?|subs=)[^\]]*{p}\]\s*\n)'
         # Group 3: Opening delimiter (----)
-        r'(\s*-{4,}\s*\n)'
+        rf'(\s*{p}-{{4,}}{p}\s*\n)'
         # Group 4: Source content
         r'(.*?)\n'
         # Closing delimiter
-        r'\s*-{4,}\s*\n'
+        rf'\s*{p}-{{4,}}{p}\s*\n'
         # Group 5: Definition content (callout explanations)
         r'(.*?)'
         # Lookahead for end of block
@@ -249,6 +539,47 @@ def get_block_pattern():
     return re.compile(pattern_string, re.MULTILINE | re.DOTALL)
 
 
+_BLOCK_PATTERN = _compile_block_pattern()
+
+# Where a get_block_pattern() match can get past its leading whitespace
+_BLOCK_HEADER_START_RE = re.compile(r'\[(?:source|subs=)')
+
+
+def iter_block_matches(content):
+    """
+    Yield the matches of get_block_pattern() in content, as finditer() would.
+    
+    A match starts with the whitespace before its header, so finditer() tries
+    the pattern from every position of every whitespace run, and each attempt
+    consumes the rest of the run: long runs of blank lines or spaces cost time
+    quadratic in their length. This finds each candidate header with a cheap
+    search first, steps back over the whitespace before it, and tries the
+    pattern only there, anchored.
+    
+    Args:
+        content (str): Document text
+    
+    Yields:
+        re.Match: Block matches, in order
+    """
+    pattern = _BLOCK_PATTERN
+    pos = 0  # End of the previous match; a match cannot start before it
+    search_pos = 0
+    while True:
+        header = _BLOCK_HEADER_START_RE.search(content, search_pos)
+        if header is None:
+            return
+        start = header.start()
+        while start > pos and content[start - 1].isspace():
+            start -= 1
+        match = pattern.match(content, start)
+        if match is None:
+            search_pos = header.start() + 1
+            continue
+        yield match
+        pos = search_pos = match.end()
+
+
 def normalize_language(lang):
     """
     Normalize the language identifier, defaulting to 'shell' when empty or unspecified.
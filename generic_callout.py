@@ -4,17 +4,54 @@ import os
 import json
 import argparse
 from collections import defaultdict
+from itertools import chain
 from converter_utils import (
-    get_block_pattern,
+    iter_block_matches,
     parse_and_replace_definitions,
     detect_edge_cases,
-    clean_source_line,
+    clean_source_block,
     get_error_message,
-    validate_unique_terms
+    validate_unique_terms,
+    read_bytes_if_matching,
+    decode_source_bytes,
+    process_files_parallel
 )
 
+# Optional: faster parsing of large classifier file lists
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-CONVERTIBLE_LANGUAGES = ['text', 'conf', 'config', 'txt', 'plaintext']
+CONVERTIBLE_LANGUAGES = frozenset(['text', 'conf', 'config', 'txt', 'plaintext'])
+
+# Patterns used for every block, compiled once at import time
+_MARKER_RE = re.compile(r'<(\d+)>')
+
+# Byte-level prefilter: a file can only need conversion if it has a text/conf
+# source header and at least one callout marker somewhere
+_GENERIC_HEADER_BYTES_RE = re.compile(rb'\[source,(?:text|conf|config|txt|plaintext)(?![\w-])', re.IGNORECASE)
+_MARKER_BYTES_RE = re.compile(rb'<\d+>')
+
+# Term before a callout marker, by priority. Each alternative is tried from the
+# start of the text, in order; the lookaheads find the leftmost occurrence anywhere,
+# as a separate re.search() per pattern would. The named group that took part in
+# the match holds the term.
+_TERM_RE = re.compile(
+    # AsciiDoc placeholder patterns (__<placeholder>__), preserved as-is
+    r'(?=.*?(?P<placeholder>__<[^>]+>__))'
+    # Key-value with = or :
+    r'|(?=.*?(?P<key>[A-Za-z0-9_\-\.]+)\s*[=:])'
+    # Section header [section]
+    r'|(?=.*?\[(?P<section>[^\]]+)\])'
+    # First word/token (for directives)
+    r'|(?P<word>[A-Za-z0-9_\-\.\/]+)'
+    # Fallback: any placeholder-like pattern
+    r'|(?=.*?(?P<fallback>__[a-zA-Z0-9_]+__))'
+)
+
+# Stray delimiter line at the end of a block's source, removed before term extraction
+_TRAILING_DELIMITER_RE = re.compile(r'\s*-{4,}\s*\n\s*$', re.MULTILINE)
 
 def extract_terms_from_source(source_lines):
     """
@@ -34,58 +71,24 @@ def extract_terms_from_source(source_lines):
         raise ValueError(get_error_message(issue_type, issue_desc))
     
     terms = {}
-    marker_pattern = re.compile(r'<(\d+)>')
     
     for line_num, line in enumerate(source_lines, start=1):
-        markers = marker_pattern.findall(line)
-        if not markers:
+        # First callout marker <N> on the line gives both the number and its position,
+        # so placeholders like __<value>__ that contain < are not mistaken for it
+        marker_match = _MARKER_RE.search(line) if '<' in line else None
+        if not marker_match:
             continue
         
-        marker_num = int(markers[0])
+        marker_num = int(marker_match.group(1))
         if marker_num in terms:
             raise ValueError(get_error_message('duplicate_marker', f'Marker {marker_num} on line {line_num}'))
         
-        # Find the position of the callout marker <N>, not just any <
-        # This handles cases where placeholders like __<value>__ contain <
-        marker_match = re.search(r'<\d+>', line)
-        if marker_match:
-            pre_marker = line[:marker_match.start()].strip()
-        else:
-            pre_marker = line[:line.find('<')].strip()
-        
-        # Priority 0: AsciiDoc placeholder patterns (__<placeholder>__)
-        # These are documentation placeholders that should be preserved as-is
-        placeholder_match = re.search(r'(__<[^>]+>__)', pre_marker)
-        if placeholder_match:
-            term = placeholder_match.group(1)
-            terms[marker_num] = term
-            continue
-        
-        # Pattern 1: Key-value with = or :
-        kv_match = re.search(r'([A-Za-z0-9_\-\.]+)\s*[=:]', pre_marker)
-        if kv_match:
-            term = kv_match.group(1)
-            terms[marker_num] = term
-            continue
-        
-        # Pattern 2: Section header [section]
-        section_match = re.search(r'\[([^\]]+)\]', pre_marker)
-        if section_match:
-            term = section_match.group(1)
-            terms[marker_num] = term
-            continue
+        pre_marker = line[:marker_match.start()].strip()
         
-        # Pattern 3: First word/token (for directives)
-        first_word_match = re.match(r'([A-Za-z0-9_\-\.\/]+)', pre_marker)
-        if first_word_match:
-            term = first_word_match.group(1)
-            terms[marker_num] = term
-            continue
-        
-        # Fallback: Look for any placeholder-like pattern
-        fallback_placeholder = re.search(r'(__[a-zA-Z0-9_]+__)', pre_marker)
-        if fallback_placeholder:
-            terms[marker_num] = fallback_placeholder.group(1)
+        # Term patterns in priority order, tried in one match (see _TERM_RE)
+        term_match = _TERM_RE.match(pre_marker)
+        if term_match:
+            terms[marker_num] = term_match.group(term_match.lastgroup)
             continue
         
         # Last fallback: use entire pre-marker content (up to 50 chars)
@@ -107,46 +110,50 @@ def convert_generic_block(full_match, terms, cleaned_source, debug=False):
     """Convert a generic text/conf code block with callouts to definition list format"""
     header = full_match.group(1)
     open_delim = full_match.group(3)
-    new_source = f"{header}{open_delim}{cleaned_source}\n----"
     def_content = full_match.group(5)
     
     if debug:
         print("Debug: def_content raw:", repr(def_content))
-        markers = re.findall(r'<(\d+)>', def_content)
+        markers = _MARKER_RE.findall(def_content)
         print(f"Debug: Markers found in defs: {markers}")
     
     new_defs, complete = parse_and_replace_definitions(def_content, terms, use_backticks=True, debug=debug)
-    return f"{new_source}\n\n{new_defs}\n\n", complete
+    # Build the replacement block in one step
+    return f"{header}{open_delim}{cleaned_source}\n----\n\n{new_defs}\n\n", complete
 
 def process_file(file_path, debug=False):
     """Process a single AsciiDoc file for generic text/conf callouts"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        try:
-            with open(file_path, 'r', encoding='latin-1') as f:
-                content = f.read()
-        except Exception as e:
-            print(f"Error: Cannot read {file_path}: {e}", file=sys.stderr)
-            return False, 0
+        # Edge case: No text/conf block or no callout marker anywhere - skip without decoding
+        data = read_bytes_if_matching(file_path, (_GENERIC_HEADER_BYTES_RE, _MARKER_BYTES_RE))
     except Exception as e:
         print(f"Error: Cannot read {file_path}: {e}", file=sys.stderr)
         return False, 0
+    if data is None:
+        return False, 0
     
-    pattern = get_block_pattern()
-    modified_content = content
+    # UTF-8 with latin-1 fallback, decoded from the one read
+    content = decode_source_bytes(data)
+    del data
+    
+    # Output is rebuilt from slices of the original content and joined once
+    segments = []
+    last_end = 0
     converted_blocks = 0
     incomplete = False
     skipped_blocks = 0
     
-    for match in pattern.finditer(content):
-        lang = match.group(2).lower()
+    for match in iter_block_matches(content):
+        lang = (match.group(2) or '').lower()
         if lang not in CONVERTIBLE_LANGUAGES:
             continue
         
         raw_source = match.group(4)
-        source_content = re.sub(r'\s*-{4,}\s*\n\s*$', '', raw_source, flags=re.MULTILINE).rstrip()
+        # The delimiter cleanup can only match where a '----' run exists
+        if '----' in raw_source:
+            source_content = _TRAILING_DELIMITER_RE.sub('', raw_source).rstrip()
+        else:
+            source_content = raw_source.rstrip()
         source_lines = source_content.splitlines()
         
         try:
@@ -157,17 +164,8 @@ def process_file(file_path, debug=False):
             if debug:
                 print(f"Debug: Extracted terms: {terms}")
             
-            # Clean markers and potential comments
-            cleaned_source_lines = []
-            for line in source_lines:
-                cleaned_line = re.sub(r'<(\d+)>', '', line).rstrip()
-                # Handle # comments
-                if re.search(r'#\s*<\d+>\s*$', line):
-                    cleaned_line = re.sub(r'#\s*<\d+>\s*$', '', cleaned_line).rstrip()
-                cleaned_line = re.sub(r'\s+#\s*$', '', cleaned_line)
-                cleaned_source_lines.append(cleaned_line)
-            
-            cleaned_source = '\n'.join(cleaned_source_lines)
+            # Strip markers and callout comments from the whole block in one pass
+            cleaned_source = clean_source_block(source_content, 'generic')
             new_block, complete = convert_generic_block(match, terms, cleaned_source, debug)
             
             if not complete:
@@ -175,7 +173,10 @@ def process_file(file_path, debug=False):
                 if debug:
                     print(f"Debug: Incomplete conversion for block in {file_path}")
             
-            modified_content = modified_content.replace(match.group(0), new_block, 1)
+            # Splice by match position so multiple identical blocks are handled independently
+            segments.append(content[last_end:match.start()])
+            segments.append(new_block)
+            last_end = match.end()
             converted_blocks += 1
             
         except ValueError as e:
@@ -189,6 +190,8 @@ def process_file(file_path, debug=False):
             continue
     
     if converted_blocks > 0 and not incomplete:
+        segments.append(content[last_end:])
+        modified_content = ''.join(segments)
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(modified_content)
@@ -208,11 +211,13 @@ def process_file(file_path, debug=False):
 def main(list_file_path, debug=False):
     """Main entry point for generic text/conf conversion"""
     if list_file_path.endswith('.json'):
-        with open(list_file_path, 'r') as f:
-            data = json.load(f)
-        file_list = []
-        for lang_group in data.values():
-            file_list.extend(lang_group)
+        if orjson is not None:
+            with open(list_file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(list_file_path, 'r') as f:
+                data = json.load(f)
+        file_list = list(chain.from_iterable(data.values()))
     else:
         with open(list_file_path, 'r') as f:
             file_list = [line.strip() for line in f if line.strip()]
@@ -222,11 +227,15 @@ def main(list_file_path, debug=False):
     errors = []
     
     print(f"Processing {len(file_list)} files for text/conf callout conversion...")
-    for file_path in sorted(file_list):
-        if not os.path.exists(file_path):
+    sorted_files = sorted(file_list)
+    exists = [os.path.exists(file_path) for file_path in sorted_files]
+    existing_files = [file_path for file_path, found in zip(sorted_files, exists) if found]
+    results = iter(process_files_parallel(process_file, existing_files, debug))
+    for file_path, found in zip(sorted_files, exists):
+        if not found:
             errors.append(f"{file_path} (does not exist)")
             continue
-        success, warns = process_file(file_path, debug)
+        success, warns = next(results)
         if success:
             converted_count += 1
         warnings_count += warns
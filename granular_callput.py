@@ -4,9 +4,17 @@ import os
 from collections import defaultdict
 import json
 import getopt
-from converter_utils import get_block_pattern, normalize_language
+from functools import lru_cache
+from converter_utils import iter_block_matches, normalize_language, process_files_parallel
 
-SUPPORTED_LANGUAGES = ['yaml', 'json', 'yml', 'bash', 'sh', 'shell', 'terminal', 'console', 'text', 'conf', 'go', 'python']
+# Lowercase language names (see normalize_language); a frozenset for the per-block membership test
+SUPPORTED_LANGUAGES = frozenset(['yaml', 'json', 'yml', 'bash', 'sh', 'shell', 'terminal', 'console', 'text', 'conf', 'go', 'python'])
+
+# Patterns used for every block, compiled once at import time
+_MARKER_RE = re.compile(r'<\d+>')
+_DEF_LINE_RE = re.compile(r'^\s*<([0-9]+)>\s*(.*)', re.MULTILINE)
+# Characters str.splitlines() breaks lines at
+_LINE_BREAK_RE = re.compile('[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
 
 def analyze_block(source_content, definition_block_content, debug=False):
     """
@@ -24,12 +32,16 @@ def analyze_block(source_content, definition_block_content, debug=False):
     if '::' in definition_block_content and '<' not in definition_block_content:
         return 'manual_already_converted', 'Block appears already converted to definition list.'
     
-    # Edge case: Multiple callouts on same line
-    for line in source_content.splitlines():
-        if len(re.findall(r'(\<\d+\>)', line)) > 1:
+    # Collect the source markers in one pass
+    source_markers_list = []
+    previous_end = None
+    # A source without '<' has no markers; skip the scan
+    for marker in (_MARKER_RE.finditer(source_content) if '<' in source_content else ()):
+        # Edge case: Multiple callouts on same line (no line break since the previous marker)
+        if previous_end is not None and not _LINE_BREAK_RE.search(source_content, previous_end, marker.start()):
             return 'manual_multi_callout', 'Multiple callouts on a single line.'
-    
-    source_markers_list = re.findall(r'(\<\d+\>)', source_content)
+        source_markers_list.append(marker.group())
+        previous_end = marker.end()
     unique_source_markers = set(source_markers_list)
     
     # Edge case: Duplicate markers in source
@@ -44,22 +56,21 @@ def analyze_block(source_content, definition_block_content, debug=False):
             return 'manual_non_sequential', f'Markers not sequential: {marker_nums} (expected {expected_sequence})'
     
     # Fixed: Capture only the number, use greedy (.*) for rest-of-line
-    definition_lines = re.findall(r'^\s*\<([0-9]+)\>\s*(.*)', definition_block_content, re.MULTILINE)
-    unique_def_markers = {f'<{m}>' for m, _ in definition_lines}
-    
-    # Edge case: Duplicate markers in definitions
-    # BUT: Allow duplicates if they're in different conditional branches
-    has_conditionals = any(keyword in definition_block_content for keyword in ['ifdef::', 'ifndef::', 'ifeval::'])
+    definition_lines = _DEF_LINE_RE.findall(definition_block_content) if '<' in definition_block_content else []
     def_marker_counts = defaultdict(int)
     for marker, _ in definition_lines:
         def_marker_counts[f'<{marker}>'] += 1
-    has_duplicates = any(count > 1 for count in def_marker_counts.values())
-    
-    if has_duplicates and not has_conditionals:
-        # True duplicates outside conditionals - can't fix
-        return 'manual_ratio_mismatch', 'Duplicate definition marker found outside source block.'
+    unique_def_markers = set(def_marker_counts)
     
-    if has_duplicates and has_conditionals:
+    # Edge case: Duplicate markers in definitions
+    # BUT: Allow duplicates if they're in different conditional branches
+    # (conditionals only matter once a duplicate is found, so only then are they looked for)
+    if len(def_marker_counts) != len(definition_lines):
+        has_conditionals = any(keyword in definition_block_content for keyword in ['ifdef::', 'ifndef::', 'ifeval::'])
+        if not has_conditionals:
+            # True duplicates outside conditionals - can't fix
+            return 'manual_ratio_mismatch', 'Duplicate definition marker found outside source block.'
+        
         # Duplicates in conditional branches - flag for manual restructuring
         # The converter can't handle this because definition lists can't have conditional terms
         duplicates = [m for m, c in def_marker_counts.items() if c > 1]
@@ -80,6 +91,17 @@ def analyze_block(source_content, definition_block_content, debug=False):
     
     return 'automatable', None
 
+@lru_cache(maxsize=1024)
+def analyze_block_cached(source_content, definition_block_content):
+    """
+    Memoized analyze_block() for non-debug runs.
+    
+    Documentation trees repeat the same example blocks across many files, so
+    identical (source, definitions) pairs are only analyzed once per process.
+    Debug runs should call analyze_block() directly to keep its output.
+    """
+    return analyze_block(source_content, definition_block_content)
+
 def process_file(file_path, debug=False):
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
@@ -87,10 +109,13 @@ def process_file(file_path, debug=False):
     except Exception:
         return {'status': 'error', 'blocks': []}
     
-    pattern = get_block_pattern()
+    # Every block header starts with '[source' or '[subs='; skip the block scan without one
+    if '[source' not in content and '[subs=' not in content:
+        return {'status': 'no_callout_block', 'blocks': []}
+    
     all_blocks = []
     
-    for match in pattern.finditer(content):
+    for match in iter_block_matches(content):
         # Normalize language - handles empty/missing language, defaults to 'shell'
         raw_lang = match.group(2) or ''
         language = normalize_language(raw_lang)
@@ -98,18 +123,50 @@ def process_file(file_path, debug=False):
             continue  # Skip unsupported langs early
         source_content = match.group(4)
         definition_block_content = match.group(5)
-        status, reason = analyze_block(source_content, definition_block_content, debug)
+        if debug:
+            status, reason = analyze_block(source_content, definition_block_content, debug)
+        else:
+            status, reason = analyze_block_cached(source_content, definition_block_content)
         all_blocks.append({
             'language': language,
             'status': status,
             'reason': reason,
-            'has_markers': len(re.findall(r'(\<\d+\>)', source_content)) > 0
+            'has_markers': _MARKER_RE.search(source_content) is not None
         })
     
     if not all_blocks:
         return {'status': 'no_callout_block', 'blocks': []}
     return {'status': 'processed', 'blocks': all_blocks}
 
+def iter_adoc_files(top):
+    """
+    Yield the paths of .adoc/.asciidoc files under top.
+    
+    Walks top-down with os.scandir, the same way os.walk() does: the files of a
+    directory before its subdirectories, symlinked directories not entered, and
+    unreadable directories skipped.
+    """
+    try:
+        with os.scandir(top) as it:
+            entries = list(it)
+    except OSError:
+        return
+    
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if not entry.is_symlink():
+                subdirs.append(entry.path)
+        elif entry.name.lower().endswith(('.adoc', '.asciidoc')):
+            yield entry.path
+    
+    for subdir in subdirs:
+        yield from iter_adoc_files(subdir)
+
 def run_granular_classification(start_dir, debug=False):
     script_path = os.path.abspath(__file__)
     script_dir = os.path.dirname(script_path)
@@ -121,44 +178,40 @@ def run_granular_classification(start_dir, debug=False):
 
     automatable_files_by_lang = defaultdict(set)
     manual_files = defaultdict(list)
-    total_files_scanned = 0
     total_files_with_callouts = 0
 
     print(f"Starting granular classification scan in: {target_dir}")
     print("-----------------------------------------------------------------")
     
-    for root, _, files in os.walk(target_dir):
-        for file_name in files:
-            if file_name.lower().endswith(('.adoc', '.asciidoc')):
-                file_path = os.path.join(root, file_name)
-                total_files_scanned += 1
-                
-                file_results = process_file(file_path, debug)
-                
-                if file_results['status'] == 'no_callout_block':
-                    continue
+    # Files are classified independently, so they are spread over a process pool
+    file_paths = list(iter_adoc_files(target_dir))
+    total_files_scanned = len(file_paths)
+    
+    for file_path, file_results in zip(file_paths, process_files_parallel(process_file, file_paths, debug)):
+        if file_results['status'] == 'no_callout_block':
+            continue
 
-                total_files_with_callouts += 1
-                
-                file_is_clean = True
-                has_callout_blocks = False
-                for block in file_results['blocks']:
-                    status = block['status']
-                    if status == 'automatable':
-                        has_callout_blocks = True
-                    elif status == 'plain_source_block':
-                        continue  # Tolerate plain blocks
-                    else:
-                        manual_files[status].append((file_path, block['reason']))
-                        file_is_clean = False
-                        break  # Early exit on first manual block
-                
-                # Only aggregate if clean *and* has at least one callout block
-                if file_is_clean and has_callout_blocks:
-                    for block in file_results['blocks']:
-                        if block['status'] == 'automatable':
-                            lang_key = f'automatable_{block["language"]}'
-                            automatable_files_by_lang[lang_key].add(file_path)
+        total_files_with_callouts += 1
+        
+        file_is_clean = True
+        has_callout_blocks = False
+        for block in file_results['blocks']:
+            status = block['status']
+            if status == 'automatable':
+                has_callout_blocks = True
+            elif status == 'plain_source_block':
+                continue  # Tolerate plain blocks
+            else:
+                manual_files[status].append((file_path, block['reason']))
+                file_is_clean = False
+                break  # Early exit on first manual block
+        
+        # Only aggregate if clean *and* has at least one callout block
+        if file_is_clean and has_callout_blocks:
+            for block in file_results['blocks']:
+                if block['status'] == 'automatable':
+                    lang_key = f'automatable_{block["language"]}'
+                    automatable_files_by_lang[lang_key].add(file_path)
     
     total_automatable = sum(len(files) for files in automatable_files_by_lang.values())
     total_manual = sum(len(files) for files in manual_files.values())
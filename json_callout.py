@@ -5,7 +5,7 @@ import json as json_module
 import argparse
 from collections import defaultdict
 from converter_utils import (
-    get_block_pattern,
+    iter_block_matches,
     parse_and_replace_definitions,
     detect_edge_cases,
     clean_source_line,
@@ -14,7 +14,7 @@ from converter_utils import (
 )
 
 
-CONVERTIBLE_LANGUAGES = ['json']
+CONVERTIBLE_LANGUAGES = frozenset(['json'])
 
 def extract_terms_from_source(source_lines):
     """
@@ -126,13 +126,14 @@ def process_file(file_path, debug=False):
         print(f"Error: Cannot read {file_path}: {e}", file=sys.stderr)
         return False, 0
     
-    pattern = get_block_pattern()
-    modified_content = content
+    # Output is rebuilt from slices of the original content and joined once
+    segments = []
+    last_end = 0
     converted_blocks = 0
     incomplete = False
     skipped_blocks = 0
     
-    for match in pattern.finditer(content):
+    for match in iter_block_matches(content):
         lang = match.group(2).lower()
         if lang not in CONVERTIBLE_LANGUAGES:
             continue
@@ -159,7 +160,10 @@ def process_file(file_path, debug=False):
                 if debug:
                     print(f"Debug: Incomplete conversion for block in {file_path}")
             
-            modified_content = modified_content.replace(match.group(0), new_block, 1)
+            # Splice by match position so multiple identical blocks are handled independently
+            segments.append(content[last_end:match.start()])
+            segments.append(new_block)
+            last_end = match.end()
             converted_blocks += 1
             
         except ValueError as e:
@@ -173,6 +177,8 @@ def process_file(file_path, debug=False):
             continue
     
     if converted_blocks > 0 and not incomplete:
+        segments.append(content[last_end:])
+        modified_content = ''.join(segments)
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(modified_content)
@@ -5,16 +5,46 @@ import json
 import argparse
 from collections import defaultdict
 from converter_utils import (
-    get_block_pattern,
+    iter_block_matches,
     parse_and_replace_definitions,
     detect_edge_cases,
     clean_source_line,
     get_error_message,
-    validate_unique_terms
+    validate_unique_terms,
+    read_bytes_if_matching,
+    decode_source_bytes,
+    process_files_parallel
 )
 
 
-CONVERTIBLE_LANGUAGES = ['python', 'py']
+CONVERTIBLE_LANGUAGES = frozenset(['python', 'py'])
+
+# Callout marker <N>, compiled once at import time
+_MARKER_RE = re.compile(r'<(\d+)>')
+
+# Byte-level prefilter: a file can only need conversion if it has a Python
+# source header and at least one callout marker somewhere
+_PYTHON_HEADER_BYTES_RE = re.compile(rb'\[source,(?:python|py)(?![\w-])', re.IGNORECASE)
+_MARKER_BYTES_RE = re.compile(rb'<\d+>')
+
+# Term before a callout marker, by priority. Each alternative is tried from the
+# start of the text, in order; the lookaheads find the leftmost occurrence anywhere,
+# as a separate re.search() per pattern would. The named group that took part in
+# the match holds the term.
+_TERM_RE = re.compile(
+    # Class definition
+    r'(?=.*?class\s+(?P<cls>[A-Za-z_][A-Za-z0-9_]*))'
+    # Function definition
+    r'|(?=.*?def\s+(?P<fn>[A-Za-z_][A-Za-z0-9_]*))'
+    # Variable assignment
+    r'|(?=.*?(?P<var>[A-Za-z_][A-Za-z0-9_]*)\s*=)'
+    # Import statement
+    r'|(?=.*?(?:from\s+\S+\s+)?import\s+(?P<imp>[A-Za-z_][A-Za-z0-9_]*(?:\s+as\s+[A-Za-z_][A-Za-z0-9_]*)?))'
+    # Function/method call
+    r'|(?=.*?(?P<call>[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)\s*\()'
+    # Dictionary key or attribute
+    r'|(?=.*?(?P<attr>[A-Za-z_][A-Za-z0-9_\.]*))'
+)
 
 def extract_terms_from_source(source_lines):
     """
@@ -35,65 +65,24 @@ def extract_terms_from_source(source_lines):
         raise ValueError(get_error_message(issue_type, issue_desc))
     
     terms = {}
-    marker_pattern = re.compile(r'<(\d+)>')
     
     for line_num, line in enumerate(source_lines, start=1):
-        markers = marker_pattern.findall(line)
-        if not markers:
+        # First callout marker <N> on the line gives both the number and its position,
+        # so placeholders like __<value>__ that contain < are not mistaken for it
+        marker_match = _MARKER_RE.search(line) if '<' in line else None
+        if not marker_match:
             continue
         
-        marker_num = int(markers[0])
+        marker_num = int(marker_match.group(1))
         if marker_num in terms:
             raise ValueError(get_error_message('duplicate_marker', f'Marker {marker_num} on line {line_num}'))
         
-        # Find the position of the callout marker <N>, not just any <
-        # This handles cases where placeholders like __<value>__ contain <
-        marker_match = re.search(r'<\d+>', line)
-        if marker_match:
-            pre_marker = line[:marker_match.start()].strip()
-        else:
-            pre_marker = line[:line.find('<')].strip()
-        
-        # Pattern 1: Class definition
-        class_match = re.search(r'class\s+([A-Za-z_][A-Za-z0-9_]*)', pre_marker)
-        if class_match:
-            term = class_match.group(1)
-            terms[marker_num] = term
-            continue
-        
-        # Pattern 2: Function definition
-        func_def_match = re.search(r'def\s+([A-Za-z_][A-Za-z0-9_]*)', pre_marker)
-        if func_def_match:
-            term = func_def_match.group(1)
-            terms[marker_num] = term
-            continue
-        
-        # Pattern 3: Variable assignment
-        var_match = re.search(r'([A-Za-z_][A-Za-z0-9_]*)\s*=', pre_marker)
-        if var_match:
-            term = var_match.group(1)
-            terms[marker_num] = term
-            continue
-        
-        # Pattern 4: Import statement
-        import_match = re.search(r'(?:from\s+\S+\s+)?import\s+([A-Za-z_][A-Za-z0-9_]*(?:\s+as\s+[A-Za-z_][A-Za-z0-9_]*)?)', pre_marker)
-        if import_match:
-            term = import_match.group(1)
-            terms[marker_num] = term
-            continue
-        
-        # Pattern 5: Function/method call
-        call_match = re.search(r'([A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)\s*\(', pre_marker)
-        if call_match:
-            term = call_match.group(1)
-            terms[marker_num] = term
-            continue
+        pre_marker = line[:marker_match.start()].strip()
         
-        # Pattern 6: Dictionary key or attribute
-        attr_match = re.search(r'([A-Za-z_][A-Za-z0-9_\.]*)', pre_marker)
-        if attr_match:
-            term = attr_match.group(1)
-            terms[marker_num] = term
+        # Term patterns in priority order, tried in one match (see _TERM_RE)
+        term_match = _TERM_RE.match(pre_marker)
+        if term_match:
+            terms[marker_num] = term_match.group(term_match.lastgroup)
             continue
         
         # Fallback
@@ -122,7 +111,7 @@ def convert_python_block(full_match, terms, cleaned_source, debug=False):
     
     if debug:
         print("Debug: def_content raw:", repr(def_content))
-        markers = re.findall(r'<(\d+)>', def_content)
+        markers = _MARKER_RE.findall(def_content)
         print(f"Debug: Markers found in defs: {markers}")
     
     new_defs, complete = parse_and_replace_definitions(def_content, terms, use_backticks=True, debug=debug)
@@ -131,27 +120,27 @@ def convert_python_block(full_match, terms, cleaned_source, debug=False):
 def process_file(file_path, debug=False):
     """Process a single AsciiDoc file for Python callouts"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        try:
-            with open(file_path, 'r', encoding='latin-1') as f:
-                content = f.read()
-        except Exception as e:
-            print(f"Error: Cannot read {file_path}: {e}", file=sys.stderr)
-            return False, 0
+        # Edge case: No Python block or no callout marker anywhere - skip without decoding
+        data = read_bytes_if_matching(file_path, (_PYTHON_HEADER_BYTES_RE, _MARKER_BYTES_RE))
     except Exception as e:
         print(f"Error: Cannot read {file_path}: {e}", file=sys.stderr)
         return False, 0
+    if data is None:
+        return False, 0
+    
+    # UTF-8 with latin-1 fallback
+    content = decode_source_bytes(data)
+    del data
     
-    pattern = get_block_pattern()
-    modified_content = content
+    # Output is rebuilt from slices of the original content and joined once
+    segments = []
+    last_end = 0
     converted_blocks = 0
     incomplete = False
     skipped_blocks = 0
     
-    for match in pattern.finditer(content):
-        lang = match.group(2).lower()
+    for match in iter_block_matches(content):
+        lang = (match.group(2) or '').lower()
         if lang not in CONVERTIBLE_LANGUAGES:
             continue
         
@@ -177,7 +166,10 @@ def process_file(file_path, debug=False):
                 if debug:
                     print(f"Debug: Incomplete conversion for block in {file_path}")
             
-            modified_content = modified_content.replace(match.group(0), new_block, 1)
+            # Splice by match position so multiple identical blocks are handled independently
+            segments.append(content[last_end:match.start()])
+            segments.append(new_block)
+            last_end = match.end()
             converted_blocks += 1
             
         except ValueError as e:
@@ -191,6 +183,8 @@ def process_file(file_path, debug=False):
             continue
     
     if converted_blocks > 0 and not incomplete:
+        segments.append(content[last_end:])
+        modified_content = ''.join(segments)
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(modified_content)
@@ -224,11 +218,15 @@ def main(list_file_path, debug=False):
     errors = []
     
     print(f"Processing {len(file_list)} files for Python callout conversion...")
-    for file_path in sorted(file_list):
-        if not os.path.exists(file_path):
+    sorted_files = sorted(file_list)
+    exists = [os.path.exists(file_path) for file_path in sorted_files]
+    existing_files = [file_path for file_path, found in zip(sorted_files, exists) if found]
+    results = iter(process_files_parallel(process_file, existing_files, debug))
+    for file_path, found in zip(sorted_files, exists):
+        if not found:
             errors.append(f"{file_path} (does not exist)")
             continue
-        success, warns = process_file(file_path, debug)
+        success, warns = next(results)
         if success:
             converted_count += 1
         warnings_count += warns
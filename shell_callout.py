@@ -10,11 +10,44 @@ from converter_utils import (
     clean_source_line,
     get_error_message,
     validate_unique_terms,
-    get_block_pattern
+    iter_block_matches,
+    read_bytes_if_matching,
+    decode_source_bytes,
+    process_files_parallel
 )
 
 
-CONVERTIBLE_LANGUAGES = ['bash', 'sh', 'terminal', 'shell', 'console']
+CONVERTIBLE_LANGUAGES = frozenset(['bash', 'sh', 'terminal', 'shell', 'console'])
+
+# Callout marker <N>, compiled once at import time
+_MARKER_RE = re.compile(r'<(\d+)>')
+
+# Byte-level prefilter: a file can only need conversion if it has a shell
+# source header and at least one callout marker somewhere
+_SHELL_HEADER_BYTES_RE = re.compile(rb'\[source,(?:bash|sh|terminal|shell|console)(?![\w-])', re.IGNORECASE)
+_MARKER_BYTES_RE = re.compile(rb'<\d+>')
+
+# Term extraction patterns, compiled once at import time
+_PROMPT_RE = re.compile(r'^\s*[$#]\s*')
+_LIST_PREFIX_RE = re.compile(r'^-\s+')
+_COMMENT_ONLY_RE = re.compile(r'^#\s*$')
+_PASSTHROUGH_RE = re.compile(r'pass:[a-z,]+\[([^\]]+)\]')
+_URL_PARAM_RE = re.compile(r'\?([a-zA-Z_][a-zA-Z0-9_]*)')
+# Key-value pair; the key is group 1
+_KEY_VALUE_RE = re.compile(r'^([a-zA-Z0-9_\-\.]+)\s*:')
+_PLACEHOLDER_RE = re.compile(r'(__<[^>]+>__)')
+# Variable assignment; the variable name is group 1
+_VAR_ASSIGN_RE = re.compile(r'\b([A-Z_][A-Z0-9_]*)\s*=')
+_FLAG_PLACEHOLDER_RE = re.compile(r'(?:^|\s)-{1,2}[a-zA-Z][a-zA-Z0-9_\-]*\s+(__<[^>]+>__)')
+_FLAG_RE = re.compile(r'(?:^|\s)(-{1,2}[a-zA-Z][a-zA-Z0-9_\-]*)')
+_DOUBLE_DASH_FLAG_RE = re.compile(r'(?:^|\s)(--[a-zA-Z][a-zA-Z0-9_\-]*)')
+_SECTION_RE = re.compile(r'(\[[^\]]+\])')
+_QUOTED_RE = re.compile(r'["\']([^"\']+)["\']')
+_URL_DOMAIN_RE = re.compile(r'https?://(?:www\.)?([^/:]+)')
+_SIMPLE_VALUE_RE = re.compile(r'^[\w\-\.]+$')
+_COMMAND_PREFIX_RE = re.compile(r'^\s*(export|sudo|sh|bash)\s+')
+_COMMAND_RE = re.compile(r'([a-zA-Z0-9_\-\.]+)')
+_FALLBACK_PLACEHOLDER_RE = re.compile(r'(__[a-zA-Z0-9_]+__)')
 
 def extract_terms_from_source(source_lines):
     """
@@ -42,33 +75,28 @@ def extract_terms_from_source(source_lines):
         raise ValueError(get_error_message(issue_type, issue_desc))
     
     terms = {}
-    marker_pattern = re.compile(r'<(\d+)>')
     
     for line_num, line in enumerate(source_lines, start=1):
-        markers = marker_pattern.findall(line)
-        if not markers:
+        # First callout marker <N> on the line gives both the number and its position,
+        # so placeholders like __<value>__ that contain < are not mistaken for it
+        marker_match = _MARKER_RE.search(line) if '<' in line else None
+        if not marker_match:
             continue
         
-        marker_num = int(markers[0])
+        marker_num = int(marker_match.group(1))
         if marker_num in terms:
             raise ValueError(get_error_message('duplicate_marker', f'Marker {marker_num} on line {line_num}'))
         
-        # Find the position of the callout marker <N>, not just any <
-        # This handles cases where placeholders like __<value>__ contain <
-        marker_match = re.search(r'<\d+>', line)
-        if marker_match:
-            pre_marker = line[:marker_match.start()].strip()
-        else:
-            pre_marker = line[:line.find('<')].strip()
+        pre_marker = line[:marker_match.start()].strip()
         
         # Remove prompt characters ($ or #) if present
-        pre_marker = re.sub(r'^\s*[$#]\s*', '', pre_marker)
+        pre_marker = _PROMPT_RE.sub('', pre_marker)
         
         # Remove YAML-style list prefix (- ) if present
-        pre_marker = re.sub(r'^-\s+', '', pre_marker)
+        pre_marker = _LIST_PREFIX_RE.sub('', pre_marker)
         
         # Edge case: Comment-only line
-        if re.match(r'^#\s*$', pre_marker) or not pre_marker:
+        if _COMMENT_ONLY_RE.match(pre_marker) or not pre_marker:
             terms[marker_num] = f"note-{marker_num}"
             continue
         
@@ -76,11 +104,11 @@ def extract_terms_from_source(source_lines):
         
         # Priority 0: AsciiDoc passthrough syntax (pass:c,a,q[...])
         # This is used for URLs and special content - extract the meaningful part
-        passthrough_match = re.search(r'pass:[a-z,]+\[([^\]]+)\]', pre_marker)
+        passthrough_match = _PASSTHROUGH_RE.search(pre_marker)
         if passthrough_match:
             passthrough_content = passthrough_match.group(1)
             # Check if there's a URL parameter after the passthrough (like ?param=value)
-            url_param_match = re.search(r'\?([a-zA-Z_][a-zA-Z0-9_]*)', line)
+            url_param_match = _URL_PARAM_RE.search(line)
             if url_param_match:
                 # If there's a URL parameter, use the full URL structure as term
                 if '#' in line:
@@ -93,7 +121,7 @@ def extract_terms_from_source(source_lines):
         
         # Priority 0.5: URL fragments and comments in URL blocks
         # Handle lines like #https://... or ?param=value
-        if pre_marker.startswith('#http') or pre_marker.startswith('http'):
+        if pre_marker.startswith(('#http', 'http')):
             terms[marker_num] = f"#https://..."
             continue
         
@@ -106,19 +134,19 @@ def extract_terms_from_source(source_lines):
         # This handles lines like: $ __<git_repository_url>__
         # But NOT: key: __<value>__ (handled by key-value pattern)
         # Check if placeholder is at the start or is the main content
-        if not re.search(r'^[a-zA-Z0-9_\-\.]+\s*:', pre_marker.strip()):
+        if not _KEY_VALUE_RE.search(pre_marker.strip()):
             # Not a key:value pattern, check for standalone placeholder
-            placeholder_match = re.search(r'(__<[^>]+>__)', pre_marker)
+            placeholder_match = _PLACEHOLDER_RE.search(pre_marker)
             if placeholder_match:
                 # Verify it's the main content (not just a value in an assignment)
-                if not re.search(r'\b[A-Z_][A-Z0-9_]*\s*=', pre_marker):
+                if not _VAR_ASSIGN_RE.search(pre_marker):
                     terms[marker_num] = placeholder_match.group(1)
                     continue
         
         # Priority 1.5: Variable assignments
         # Patterns: VAR=value, export VAR=value, VAR="value"
         # Extract: VAR
-        var_match = re.search(r'\b([A-Z_][A-Z0-9_]*)\s*=', pre_marker)
+        var_match = _VAR_ASSIGN_RE.search(pre_marker)
         if var_match:
             term = var_match.group(1)
             terms[marker_num] = term
@@ -128,7 +156,7 @@ def extract_terms_from_source(source_lines):
         # If a flag is followed by a placeholder like __<value>__, extract the placeholder
         # since that's what the callout is explaining
         # Patterns: --flag __<value>__, --flag=__<value>__
-        flag_with_placeholder = re.search(r'(?:^|\s)-{1,2}[a-zA-Z][a-zA-Z0-9_\-]*\s+(__<[^>]+>__)', pre_marker)
+        flag_with_placeholder = _FLAG_PLACEHOLDER_RE.search(pre_marker)
         if flag_with_placeholder:
             terms[marker_num] = flag_with_placeholder.group(1)
             continue
@@ -136,11 +164,11 @@ def extract_terms_from_source(source_lines):
         # Priority 2.5: Standalone flags (without placeholder arguments)
         # Patterns: --flag, --flag=value, -f
         # Extract: just the flag name
-        flag_match = re.search(r'(?:^|\s)(-{1,2}[a-zA-Z][a-zA-Z0-9_\-]*)', pre_marker)
+        flag_match = _FLAG_RE.search(pre_marker)
         if flag_match:
             term = flag_match.group(1)
             # Prefer longest match (--flag over -f)
-            double_dash = re.search(r'(?:^|\s)(--[a-zA-Z][a-zA-Z0-9_\-]*)', pre_marker)
+            double_dash = _DOUBLE_DASH_FLAG_RE.search(pre_marker)
             if double_dash:
                 term = double_dash.group(1)
             terms[marker_num] = term
@@ -151,7 +179,7 @@ def extract_terms_from_source(source_lines):
         # But NOT for lines that start with [ which are config sections
         # Extract: key (not the value)
         if not pre_marker.strip().startswith('['):
-            kv_match = re.search(r'^([a-zA-Z0-9_\-\.]+)\s*:', pre_marker.strip())
+            kv_match = _KEY_VALUE_RE.search(pre_marker.strip())
             if kv_match:
                 term = kv_match.group(1)
                 terms[marker_num] = term
@@ -159,7 +187,7 @@ def extract_terms_from_source(source_lines):
         
         # Priority 3.5: Config section headers like [section.name]
         # Extract the full section header
-        section_match = re.search(r'(\[[^\]]+\])', pre_marker)
+        section_match = _SECTION_RE.search(pre_marker)
         if section_match:
             term = section_match.group(1)
             terms[marker_num] = term
@@ -168,12 +196,12 @@ def extract_terms_from_source(source_lines):
         # Priority 4: Quoted strings (file paths, URLs, values)
         # For: "http://example.com/" -> extract domain
         # For: file://... or "value" -> extract meaningful part
-        quoted_match = re.search(r'["\']([^"\']+)["\']', pre_marker)
+        quoted_match = _QUOTED_RE.search(pre_marker)
         if quoted_match:
             quoted_value = quoted_match.group(1)
             # For URLs, extract domain
             if quoted_value.startswith(('http://', 'https://')):
-                domain_match = re.search(r'https?://(?:www\.)?([^/:]+)', quoted_value)
+                domain_match = _URL_DOMAIN_RE.search(quoted_value)
                 if domain_match:
                     term = domain_match.group(1)
                 else:
@@ -181,7 +209,7 @@ def extract_terms_from_source(source_lines):
                 terms[marker_num] = term
                 continue
             # For short alphanumeric values, use as-is
-            if len(quoted_value) < 30 and re.match(r'^[\w\-\.]+$', quoted_value):
+            if len(quoted_value) < 30 and _SIMPLE_VALUE_RE.match(quoted_value):
                 terms[marker_num] = quoted_value
                 continue
         
@@ -190,8 +218,8 @@ def extract_terms_from_source(source_lines):
         # For: "oc create -f file.yaml" -> "oc"
         # For: "export CLUSTER_NAME=..." -> "export" (but this should have matched var pattern above)
         # Remove common command prefixes like "export", "sudo"
-        clean_line = re.sub(r'^\s*(export|sudo|sh|bash)\s+', '', pre_marker)
-        command_match = re.match(r'([a-zA-Z0-9_\-\.]+)', clean_line)
+        clean_line = _COMMAND_PREFIX_RE.sub('', pre_marker)
+        command_match = _COMMAND_RE.match(clean_line)
         if command_match:
             term = command_match.group(1)
             terms[marker_num] = term
@@ -199,7 +227,7 @@ def extract_terms_from_source(source_lines):
         
         # Fallback: Look for any placeholder-like pattern as last resort
         # This catches cases like __value__ without angle brackets
-        fallback_placeholder = re.search(r'(__[a-zA-Z0-9_]+__)', pre_marker)
+        fallback_placeholder = _FALLBACK_PLACEHOLDER_RE.search(pre_marker)
         if fallback_placeholder:
             terms[marker_num] = fallback_placeholder.group(1)
             continue
@@ -221,7 +249,7 @@ def convert_shell_block(full_match, terms, cleaned_source, debug=False):
     
     if debug:
         print("Debug: def_content raw:", repr(def_content))
-        markers = re.findall(r'<(\d+)>', def_content)
+        markers = _MARKER_RE.findall(def_content)
         print(f"Debug: Markers found in defs: {markers}")
     
     new_defs, complete = parse_and_replace_definitions(def_content, terms, use_backticks=True, debug=debug)
@@ -230,27 +258,27 @@ def convert_shell_block(full_match, terms, cleaned_source, debug=False):
 def process_file(file_path, debug=False):
     """Process a single AsciiDoc file for shell callouts"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        try:
-            with open(file_path, 'r', encoding='latin-1') as f:
-                content = f.read()
-        except Exception as e:
-            print(f"Error: Cannot read {file_path}: {e}", file=sys.stderr)
-            return False, 0
+        # Edge case: No shell block or no callout marker anywhere - skip without decoding
+        data = read_bytes_if_matching(file_path, (_SHELL_HEADER_BYTES_RE, _MARKER_BYTES_RE))
     except Exception as e:
         print(f"Error: Cannot read {file_path}: {e}", file=sys.stderr)
         return False, 0
+    if data is None:
+        return False, 0
+    
+    # UTF-8 with latin-1 fallback
+    content = decode_source_bytes(data)
+    del data
     
-    pattern = get_block_pattern()
-    modified_content = content
+    # Output is rebuilt from slices of the original content and joined once
+    segments = []
+    last_end = 0
     converted_blocks = 0
     incomplete = False
     skipped_blocks = 0
     
-    for match in pattern.finditer(content):
-        lang = match.group(2).lower()
+    for match in iter_block_matches(content):
+        lang = (match.group(2) or '').lower()
         if lang not in CONVERTIBLE_LANGUAGES:
             continue
         
@@ -276,7 +304,10 @@ def process_file(file_path, debug=False):
                 if debug:
                     print(f"Debug: Incomplete conversion for block in {file_path}")
             
-            modified_content = modified_content.replace(match.group(0), new_block, 1)
+            # Splice by match position so multiple identical blocks are handled independently
+            segments.append(content[last_end:match.start()])
+            segments.append(new_block)
+            last_end = match.end()
             converted_blocks += 1
             
         except ValueError as e:
@@ -290,6 +321,8 @@ def process_file(file_path, debug=False):
             continue
     
     if converted_blocks > 0 and not incomplete:
+        segments.append(content[last_end:])
+        modified_content = ''.join(segments)
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(modified_content)
@@ -323,11 +356,15 @@ def main(list_file_path, debug=False):
     errors = []
     
     print(f"Processing {len(file_list)} files for shell/bash callout conversion...")
-    for file_path in sorted(file_list):
-        if not os.path.exists(file_path):
+    sorted_files = sorted(file_list)
+    exists = [os.path.exists(file_path) for file_path in sorted_files]
+    existing_files = [file_path for file_path, found in zip(sorted_files, exists) if found]
+    results = iter(process_files_parallel(process_file, existing_files, debug))
+    for file_path, found in zip(sorted_files, exists):
+        if not found:
             errors.append(f"{file_path} (does not exist)")
             continue
-        success, warns = process_file(file_path, debug)
+        success, warns = next(results)
         if success:
             converted_count += 1
         warnings_count += warns
@@ -5,16 +5,33 @@ import json
 import argparse
 from collections import defaultdict
 from converter_utils import (
-    get_block_pattern,
+    iter_block_matches,
     parse_and_replace_definitions,
     detect_edge_cases,
-    clean_source_line,
+    clean_source_block,
     get_error_message,
-    validate_unique_terms
+    validate_unique_terms,
+    read_bytes_if_matching,
+    decode_source_bytes,
+    write_file_atomic,
+    process_files_parallel
 )
 
 
-CONVERTIBLE_LANGUAGES = ['yaml', 'yml']
+CONVERTIBLE_LANGUAGES = frozenset(['yaml', 'yml'])
+
+# Patterns used for every block, compiled once at import time
+_MARKER_RE = re.compile(r'<(\d+)>')
+_COMMENT_ONLY_RE = re.compile(r'^#\s*$')
+_KEY_RE = re.compile(r'^(.*?)(?::|$)')
+_TERM_STRIP_RE = re.compile(r'^[-—\s]+|["\']|[-—\s]+$')
+_LEADING_COMMENT_RE = re.compile(r'^#\s*')
+_TRAILING_DELIMITER_RE = re.compile(r'\s*-{4,}\s*\n\s*$', re.MULTILINE)
+
+# Byte-level prefilter: a file can only need conversion if it has a YAML
+# source header and at least one callout marker somewhere
+_YAML_HEADER_BYTES_RE = re.compile(rb'\[source,(?:yaml|yml)(?![\w-])', re.IGNORECASE)
+_MARKER_BYTES_RE = re.compile(rb'<\d+>')
 
 def extract_terms_from_source(source_lines):
     """
@@ -35,39 +52,36 @@ def extract_terms_from_source(source_lines):
         raise ValueError(get_error_message(issue_type, issue_desc))
     
     terms = {}
-    marker_pattern = re.compile(r'<(\d+)>')
     
     for line_num, line in enumerate(source_lines, start=1):
-        markers = marker_pattern.findall(line)
-        if not markers:
+        # First callout marker <N> on the line gives both the number and its position,
+        # so placeholders like __<value>__ that contain < are not mistaken for it
+        marker_match = _MARKER_RE.search(line) if '<' in line else None
+        if not marker_match:
             continue
         
-        marker_num = int(markers[0])
+        marker_num = int(marker_match.group(1))
         if marker_num in terms:
             raise ValueError(get_error_message('duplicate_marker', f'Marker {marker_num} on line {line_num}'))
         
-        # Find the position of the callout marker <N>, not just any <
-        # This handles cases where placeholders like __<value>__ contain <
-        marker_match = re.search(r'<\d+>', line)
-        if marker_match:
-            pre_marker = line[:marker_match.start()]
-        else:
-            pre_marker = line[:line.find('<')]
+        pre_marker = line[:marker_match.start()]
         
         # Edge case: Comment-only line (just # with whitespace)
-        if re.match(r'^#\s*$', pre_marker.strip()):
+        pre_marker_stripped = pre_marker.strip()
+        if pre_marker_stripped.startswith('#') and _COMMENT_ONLY_RE.match(pre_marker_stripped):
             # Use generic term for comment-only callouts
             terms[marker_num] = f"note-{marker_num}"
             continue
         
-        colon_match = re.search(r'^(.*?)(?::|$)', pre_marker.strip())
+        colon_match = _KEY_RE.search(pre_marker_stripped)
         if colon_match:
             term = colon_match.group(1).strip()
             # Strip leading dashes (for list items), quotes, and whitespace
             # But preserve dots in paths like 'path.to.value'
-            term = re.sub(r'^[-—\s]+|["\']|[-—\s]+$', '', term).strip()
+            term = _TERM_STRIP_RE.sub('', term).strip()
             # Also strip comment markers if present
-            term = re.sub(r'^#\s*', '', term).strip()
+            if term.startswith('#'):
+                term = _LEADING_COMMENT_RE.sub('', term).strip()
             
             if term:
                 terms[marker_num] = term
@@ -90,7 +104,7 @@ def convert_yaml_block(full_match, terms, cleaned_source, debug=False):
     
     if debug:
         print("Debug: def_content raw:", repr(def_content))
-        markers = re.findall(r'<(\d+)>', def_content)
+        markers = _MARKER_RE.findall(def_content)
         print(f"Debug: Markers found in defs: {markers}")
     
     # YAML keys don't need backticks, so use_backticks=False
@@ -111,33 +125,35 @@ def process_file(file_path, debug=False):
     Returns: (success: bool, warnings: int)
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except UnicodeDecodeError:
-        # Try fallback encoding
-        try:
-            with open(file_path, 'r', encoding='latin-1') as f:
-                content = f.read()
-        except Exception as e:
-            print(f"Error: Cannot read {file_path}: {e}", file=sys.stderr)
-            return False, 0
+        # Edge case: No YAML block or no callout marker anywhere - skip without decoding
+        data = read_bytes_if_matching(file_path, (_YAML_HEADER_BYTES_RE, _MARKER_BYTES_RE))
     except Exception as e:
         print(f"Error: Cannot read {file_path}: {e}", file=sys.stderr)
         return False, 0
+    if data is None:
+        return False, 0
     
-    pattern = get_block_pattern()
-    modified_content = content
+    # UTF-8 with latin-1 fallback
+    content = decode_source_bytes(data)
+    del data
+    
+    # Output is rebuilt from slices of the original content and joined once
+    segments = []
+    last_end = 0
     converted_blocks = 0
     incomplete = False
     skipped_blocks = 0
     
-    for match in pattern.finditer(content):
-        lang = match.group(2).lower()
+    for match in iter_block_matches(content):
+        lang = (match.group(2) or '').lower()
         if lang not in CONVERTIBLE_LANGUAGES:
             continue
         
         raw_source = match.group(4)
-        source_content = re.sub(r'\s*-{4,}\s*\n\s*$', '', raw_source, flags=re.MULTILINE).rstrip()
+        if '----' in raw_source:
+            source_content = _TRAILING_DELIMITER_RE.sub('', raw_source).rstrip()
+        else:
+            source_content = raw_source.rstrip()
         source_lines = source_content.splitlines()
         
         try:
@@ -149,9 +165,8 @@ def process_file(file_path, debug=False):
             if debug:
                 print(f"Debug: Extracted terms: {terms}")
             
-            # Clean source lines using shared utility
-            cleaned_source_lines = [clean_source_line(line, 'yaml') for line in source_lines]
-            cleaned_source = '\n'.join(cleaned_source_lines)            
+            # Strip markers and callout comments from the whole block in one pass
+            cleaned_source = clean_source_block(source_content, 'yaml')
             
             new_block, complete = convert_yaml_block(match, terms, cleaned_source, debug)
             if not complete:
@@ -159,8 +174,10 @@ def process_file(file_path, debug=False):
                 if debug:
                     print(f"Debug: Incomplete conversion for block in {file_path}")
             
-            # Edge case: Use replace with count=1 to handle multiple identical blocks
-            modified_content = modified_content.replace(match.group(0), new_block, 1)
+            # Splice by match position so multiple identical blocks are handled independently
+            segments.append(content[last_end:match.start()])
+            segments.append(new_block)
+            last_end = match.end()
             converted_blocks += 1
             
         except ValueError as e:
@@ -177,11 +194,14 @@ def process_file(file_path, debug=False):
     
     # Edge case: Only write if we successfully converted at least one block AND no incomplete conversions
     if converted_blocks > 0 and not incomplete:
+        segments.append(content[last_end:])
+        modified_content = ''.join(segments)
+        # Drop the original text so only one full copy of the file is held during the write
+        del content, segments
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(modified_content)
-                if debug and skipped_blocks > 0:
-                    print(f"Debug: Converted {converted_blocks} blocks, skipped {skipped_blocks} blocks")
+            write_file_atomic(file_path, modified_content)
+            if debug and skipped_blocks > 0:
+                print(f"Debug: Converted {converted_blocks} blocks, skipped {skipped_blocks} blocks")
             return True, 0
         except Exception as e:
             print(f"Error: Cannot write to {file_path}: {e}", file=sys.stderr)
@@ -210,11 +230,15 @@ def main(list_file_path, debug=False):
     errors = []
     
     print(f"Processing {len(file_list)} files for YAML callout conversion...")
-    for file_path in sorted(file_list):
-        if not os.path.exists(file_path):
+    sorted_files = sorted(file_list)
+    exists = [os.path.exists(file_path) for file_path in sorted_files]
+    existing_files = [file_path for file_path, found in zip(sorted_files, exists) if found]
+    results = iter(process_files_parallel(process_file, existing_files, debug))
+    for file_path, found in zip(sorted_files, exists):
+        if not found:
             errors.append(f"{file_path} (does not exist)")
             continue
-        success, warns = process_file(file_path, debug)
+        success, warns = next(results)
         if success:
             converted_count += 1
         warnings_count += warns